@@ -1,23 +1,25 @@
 import os
-import yaml
+import shutil
 import logging
 import pandas as pd
+from typing import Union
 
 from airflow.decorators import dag, task
 from airflow.utils.task_group import TaskGroup
 from airflow.exceptions import AirflowException
 from pendulum import datetime
 
+from include.config import get_config
 from include.etl.extract.extract_from_local import load_folder_to_dict
 from include.etl.extract.extract_from_s3 import load_s3_files_to_dict
-from include.etl.load.load_data import load_data_to_snowflake
+from include.etl.load.load_data import load_data_to_snowflake, create_product_sales_performance_table
+from include.etl.materialize import materialize, read_materialized, expire_run_folders
 
 from include.etl.transformations.transform_sales_data import transform_sales_data
 from include.etl.transformations.transform_products_data import transform_products_data
 from include.etl.transformations.enrich_merged_data import enrich_merged_data
 from include.etl.transformations.merge_sales_and_products import merge_sales_and_products
 from include.etl.transformations.generate_hourly_sales_trends import generate_hourly_sales_trends
-from include.etl.transformations.generate_product_sales_performance import generate_product_sales_performance
 from include.etl.transformations.generate_seasonal_sales_patterns import generate_seasonal_sales_patterns
 from include.etl.transformations.analyze_revenue_concentration_by_region import analyze_revenue_concentration_by_region
 from include.etl.transformations.transform_order_status_over_time import transform_order_status_over_time
@@ -27,10 +29,16 @@ logger = logging.getLogger(__name__)
 
 current_file = os.path.abspath(__file__)
 project_root = os.path.abspath(os.path.join(current_file, "..", ".."))
-config_path = os.path.join(project_root, "include", "config.yaml")
 
-with open(config_path, "r") as file:
-    config = yaml.safe_load(file)
+config = get_config()
+
+
+def get_run_folder(run_id: str) -> str:
+    """
+    Return the run-scoped folder where intermediate Parquet files are materialized.
+    Tasks may run on different workers, so intermediate.folder must point at storage every worker can reach.
+    """
+    return os.path.join(config["intermediate"]["folder"], run_id)
 
 
 @dag(
@@ -74,7 +82,7 @@ def retail_etl_dag():
             raise AirflowException(f"Unsupported data source: {source}")
 
     @task()
-    def transform_sales(files: dict) -> pd.DataFrame:
+    def transform_sales(files: dict, run_id: str = None) -> str:
         """
         Transforms the raw sales data after extraction.
         """
@@ -85,10 +93,10 @@ def retail_etl_dag():
         sales_df = pd.read_csv(sales_raw) if isinstance(sales_raw, str) else sales_raw
         transformed_df = transform_sales_data(sales_df)
         logger.info(f"Columns after transformation: {list(transformed_df.columns)}")
-        return transformed_df
+        return materialize(transformed_df, "sales", get_run_folder(run_id))
 
     @task()
-    def transform_products(files: dict) -> pd.DataFrame:
+    def transform_products(files: dict, run_id: str = None) -> str:
         """
         Transform the raw product data from input files into a cleaned DataFrame.
         """
@@ -97,76 +105,89 @@ def retail_etl_dag():
             logger.error("Products data not found in extracted files.")
             raise AirflowException("Products data not found in extracted files.")
         products_df = pd.read_csv(products_raw) if isinstance(products_raw, str) else products_raw
-        return transform_products_data(products_df)
+        return materialize(transform_products_data(products_df), "products", get_run_folder(run_id))
 
     @task()
-    def merge_data(sales_df: pd.DataFrame, products_df: pd.DataFrame) -> pd.DataFrame:
+    def merge_data(sales_path: str, products_path: str, run_id: str = None) -> str:
         """
         Merge sales data with product data into a single DataFrame.
         """
+        merged_df = merge_sales_and_products(read_materialized(sales_path), read_materialized(products_path))
         logger.info("Completed merge_data task.")
-        return merge_sales_and_products(sales_df, products_df)
+        return materialize(merged_df, "merged", get_run_folder(run_id))
 
     @task()
-    def enrich_data(merged_df: pd.DataFrame) -> pd.DataFrame:
+    def enrich_data(merged_path: str, run_id: str = None) -> str:
         """
         Enrich the merged DataFrame with additional computed or lookup information.
         """
+        enriched_df = enrich_merged_data(read_materialized(merged_path))
         logger.info("Completed enrich_data task.")
-        return enrich_merged_data(merged_df)
+        return materialize(enriched_df, "enriched", get_run_folder(run_id))
 
-    @task()
-    def hourly_sales_trends(enriched_df: pd.DataFrame) -> pd.DataFrame:
+    @task(multiple_outputs=True)
+    def run_analyses(enriched_path: str) -> dict:
         """
-        Generate hourly sales trend metrics from the enriched sales data.
+        Compute all analysis DataFrames from the materialized enriched data.
+        Each analysis reads only its own columns, and each result is pushed as its own XCom.
         """
-        logger.info("Completed hourly_sales_trends task.")
-        return generate_hourly_sales_trends(enriched_df)
+        analyses = {
+            "hourly": generate_hourly_sales_trends(enriched_path),
+            "seasonal": generate_seasonal_sales_patterns(enriched_path),
+            "revenue": analyze_revenue_concentration_by_region(enriched_path),
+        }
+
+        try:
+            analyses["status"] = transform_order_status_over_time(enriched_path)
+        except Exception as e:
+            logger.error(f"Failed to compute order status breakdown: {e}")
+            raise AirflowException(f"Order status breakdown failed: {e}")
+
+        logger.info("Completed run_analyses task.")
+        return analyses
 
     @task()
-    def product_performance_task(merged_df: pd.DataFrame) -> pd.DataFrame:
-        """
-        Calculate product sales performance metrics from merged sales and product data.
-        """
-        logger.info("Completed product_performance_task.")
-        return generate_product_sales_performance(merged_df)
+    def load_to_snowflake_task(df: Union[pd.DataFrame, str], database: str, schema_name: str, table_name: str) -> None:
+        df = read_materialized(df) if isinstance(df, str) else df
+        logger.info(f"Loading DataFrame to {database}.{schema_name}.{table_name}")
+        logger.info(f"DataFrame shape: {df.shape}")
+        logger.info(f"First 5 rows:\n{df.head().to_string()}")
+        load_data_to_snowflake(df=df, database=database, schema=schema_name, table=table_name)
 
     @task()
-    def seasonal_sales_task(enriched_df: pd.DataFrame) -> pd.DataFrame:
+    def product_performance_sql_task(database: str, source_conf: dict, target_conf: dict) -> None:
         """
-        Task to analyze seasonal sales patterns by quarter and category.
+        Calculate product sales performance metrics in Snowflake from the loaded merged sales and product data.
         """
-        logger.info("Completed seasonal_sales_task.")
-        return generate_seasonal_sales_patterns(enriched_df)
+        create_product_sales_performance_table(
+            database=database,
+            source_schema=source_conf["schema"],
+            source_table=source_conf["table"],
+            schema=target_conf["schema"],
+            table=target_conf["table"]
+        )
+        logger.info("Completed product_performance_sql_task.")
 
     @task()
-    def revenue_concentration_task(enriched_df: pd.DataFrame) -> pd.DataFrame:
+    def expire_intermediates() -> None:
         """
-        Task to compute revenue concentration and inequality metrics by region.
+        Remove run folders older than the configured retention, such as those kept by failed runs.
         """
-        logger.info("Completed revenue_concentration_task.")
-        return analyze_revenue_concentration_by_region(enriched_df)
+        expire_run_folders(config["intermediate"]["folder"], config["intermediate"]["retention_hours"])
 
     @task()
-    def order_status_analysis_task(enriched_df: pd.DataFrame) -> pd.DataFrame:
+    def cleanup_intermediates(run_id: str = None) -> None:
         """
-        Airflow task to analyze weekly order status breakdown.
+        Remove the run's materialized Parquet files once every load has succeeded.
+        Failed runs keep their files so cleared tasks can be retried, and expire_intermediates removes them later.
         """
-        try:
-            return transform_order_status_over_time(enriched_df)
-        except Exception as e:
-            logger.error(f"Failed to compute order status breakdown: {e}")
-            raise AirflowException(f"Order status breakdown failed: {e}")
-
-    @task()
-    def load_to_snowflake_task(df: pd.DataFrame, database: str, schema_name: str, table_name: str) -> None:
-        logger.info(f"Loading DataFrame to {database}.{schema_name}.{table_name}")
-        logger.info(f"DataFrame shape: {df.shape}")
-        logger.info(f"First 5 rows:\n{df.head().to_string()}")
-        load_data_to_snowflake(df=df, database=database, schema=schema_name, table=table_name)
+        run_folder = get_run_folder(run_id)
+        shutil.rmtree(run_folder, ignore_errors=True)
+        logger.info(f"Removed intermediate folder {run_folder}")
 
     with TaskGroup("extraction") as extraction:
         extracted_files = extract_data(config)
+        expire_intermediates() >> extracted_files
 
     with TaskGroup("transformation") as transformation:
         sales_df = transform_sales(extracted_files)
@@ -175,35 +196,39 @@ def retail_etl_dag():
         enriched_df = enrich_data(merged_df)
 
     with TaskGroup("analysis") as analysis:
-        sales_trends_df = hourly_sales_trends(enriched_df)
-        product_perf_df = product_performance_task(enriched_df)
-        seasonal_trends_df = seasonal_sales_task(enriched_df)
-        revenue_concentration_df = revenue_concentration_task(enriched_df)
-        order_status_df = order_status_analysis_task(enriched_df)
+        analyses = run_analyses(enriched_df)
+        sales_trends_df = analyses["hourly"]
+        seasonal_trends_df = analyses["seasonal"]
+        revenue_concentration_df = analyses["revenue"]
+        order_status_df = analyses["status"]
 
     with TaskGroup("loading") as loading:
-        tables_config = {
-            "load_sales": ("sales_df", "sales"),
-            "load_product": ("products_df", "product"),
-            "load_merged_sales_products": ("merged_df", "merged_sales_products"),
-            "load_enriched_sales": ("enriched_df", "enriched_sales_products"),
-            "load_hourly_sales_trends": ("sales_trends_df", "sales_hourly_trends"),
-            "load_product_performance": ("product_perf_df", "products_sales_performance"),
-            "load_seasonal_sales_patterns": ("seasonal_trends_df", "seasonal_sales_patterns"),
-            "load_revenue_concentration_analysis": ("revenue_concentration_df", "revenue_concentration_analysis"),
-            "load_order_status_over_time": ("order_status_df", "order_status_over_time"),
-        }
-
-        for task_id, (df_name, target_key) in tables_config.items():
-            df = locals()[df_name]
-            target_conf = config["snowflake"]["targets"][target_key]
-
-            load_to_snowflake_task.override(task_id=task_id)(
-                df=df,
-                database=config["snowflake"]["database"],
-                schema_name=target_conf["schema"],
-                table_name=target_conf["table"]
-            )
+        targets = config["snowflake"]["targets"]
+        tables_config = [
+            (sales_df, "sales"),
+            (products_df, "product"),
+            (merged_df, "merged_sales_products"),
+            (enriched_df, "enriched_sales_products"),
+            (sales_trends_df, "sales_hourly_trends"),
+            (seasonal_trends_df, "seasonal_sales_patterns"),
+            (revenue_concentration_df, "revenue_concentration_analysis"),
+            (order_status_df, "order_status_over_time"),
+        ]
+
+        load_tables = load_to_snowflake_task.override(task_id="load_tables").partial(
+            database=config["snowflake"]["database"]
+        ).expand_kwargs([
+            {"df": df, "schema_name": targets[target_key]["schema"], "table_name": targets[target_key]["table"]}
+            for df, target_key in tables_config
+        ])
+
+        load_tables >> product_performance_sql_task(
+            database=config["snowflake"]["database"],
+            source_conf=targets["merged_sales_products"],
+            target_conf=targets["products_sales_performance"]
+        )
+
+    loading >> cleanup_intermediates()
 
 
 retail_etl_dag()
\ No newline at end of file
@@ -0,0 +1,15 @@
+import os
+import yaml
+from functools import lru_cache
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "config.yaml")
+
+
+@lru_cache(maxsize=1)
+def get_config() -> dict:
+    """
+    Load the project configuration from include/config.yaml.
+    The parsed config is cached, so the DAG and extract modules share a single read per process.
+    """
+    with open(CONFIG_PATH, "r") as file:
+        return yaml.safe_load(file)
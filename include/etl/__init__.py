@@ -0,0 +1,4 @@
+import pandas as pd
+
+# Copy-on-Write lets transformers hand back modified frames without eagerly cloning untouched columns
+pd.set_option("mode.copy_on_write", True)
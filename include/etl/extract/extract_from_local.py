@@ -1,53 +1,81 @@
 import os
+import re
+import orjson
 import pandas as pd
-import yaml
+import pyarrow.csv as pacsv
+import pyarrow.dataset as ds
 import logging
 
+from include.config import get_config
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-with open("include/config.yaml", "r") as file:
-    config = yaml.safe_load(file)
+config = get_config()
+
+SHARD_SUFFIX = re.compile(r"_\d+$")
 
+CSV_FORMAT = ds.CsvFileFormat(
+    read_options=pacsv.ReadOptions(block_size=8 << 20),
+    convert_options=pacsv.ConvertOptions(strings_can_be_null=True)
+)
 
 def load_folder_to_dict(folder_path: str, extensions=("csv", "json")) -> dict:
     """
     Loads CSV and/or JSON files from a folder into a dictionary of Pandas DataFrames.
     Supported extensions: .csv, .json
+
+    Two or more files whose names differ only by a numeric shard suffix (e.g. sales_data_1.csv, sales_data_2.csv)
+    are combined under their shared key, while a single file keeps its full name (e.g. sales_data_2025.csv). CSV groups are scanned as one PyArrow dataset, so all shards
+    are parsed in parallel on Arrow's thread pool and converted to pandas once.
     """
     logger.info(f"Attempting to load files from: {folder_path}")
     if not os.path.exists(folder_path):
         logger.error(f"Directory not found: {folder_path}")
         raise FileNotFoundError(f"Directory does not exist: {folder_path}")
 
-    data_dict = {}
-
     current_file = os.path.abspath(__file__)
     project_root = os.path.abspath(os.path.join(current_file, "..", "..", "..", ".."))
     data_folder = os.path.join(project_root, config['local']['folder'])
 
-    for filename in os.listdir(folder_path):
+    shard_groups = {}
+    for filename in sorted(os.listdir(folder_path)):
         ext = filename.split(".")[-1].lower()
         if ext not in extensions:
             continue
 
-        key = os.path.splitext(filename)[0]
-        if not key:
-            logger.warning(f"Skipping file with empty key: {filename}")
-            continue
+        stem = os.path.splitext(filename)[0]
+        shard_groups.setdefault((SHARD_SUFFIX.sub("", stem), ext), []).append((stem, filename))
+
+    # A numeric suffix only marks a shard when several files share the stem, so sales_data_2025.csv keeps its key
+    file_groups = {}
+    for (shard_key, ext), files in shard_groups.items():
+        for stem, filename in files:
+            key = shard_key if len(files) > 1 else stem
+            if not key:
+                logger.warning(f"Skipping file with empty key: {filename}")
+                continue
 
-        file_path = os.path.join(data_folder, filename)
+            file_groups.setdefault((key, ext), []).append(os.path.join(data_folder, filename))
+
+    data_dict = {}
 
+    for (key, ext), file_paths in file_groups.items():
         try:
             if ext == "csv":
-                df = pd.read_csv(file_path)
+                table = ds.dataset(file_paths, format=CSV_FORMAT).to_table(use_threads=True)
+                df = table.to_pandas(self_destruct=True)
             elif ext == "json":
-                df = pd.read_json(file_path, orient="records")
+                frames = []
+                for file_path in file_paths:
+                    with open(file_path, "rb") as file:
+                        frames.append(pd.DataFrame.from_records(orjson.loads(file.read())))
+                df = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
 
             data_dict[key] = df
-            logger.info(f"Loaded {ext.upper()} file: {filename} (rows: {len(df)})")
+            logger.info(f"Loaded {ext.upper()} files for '{key}': {len(file_paths)} file(s) (rows: {len(df)})")
 
         except Exception as e:
-            logger.error(f"Error reading {filename}: {e}")
+            logger.error(f"Error reading {ext.upper()} files for '{key}': {e}")
 
-    return data_dict
\ No newline at end of file
+    return data_dict
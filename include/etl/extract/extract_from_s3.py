@@ -1,14 +1,21 @@
 from airflow.providers.amazon.aws.hooks.s3 import S3Hook
+import orjson
 import pandas as pd
-from io import StringIO
+import pyarrow as pa
+import pyarrow.csv as pacsv
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from airflow.exceptions import AirflowException
 
 logger = logging.getLogger(__name__)
 
+MAX_DOWNLOAD_WORKERS = 16
+
+
 def load_s3_files_to_dict(config: dict, extensions=("csv", "json")) -> dict:
     """
     Load CSV and JSON files from S3 using Airflow's S3Hook.
+    Objects are downloaded concurrently (config["max_workers"], default 16) and parsed once all have arrived.
     """
 
     aws_conn_id = config.get("aws_conn_id", "aws_conn_id")
@@ -25,24 +32,37 @@ def load_s3_files_to_dict(config: dict, extensions=("csv", "json")) -> dict:
         logger.warning(f"No files found in bucket '{bucket}' with prefix '{prefix}'")
         return {}
 
-    data_dict = {}
+    s3_client = s3_hook.get_conn()
 
-    for key in keys:
-        if not key.lower().endswith(extensions):
-            continue
+    def fetch(key: str) -> tuple:
+        try:
+            return key, s3_client.get_object(Bucket=bucket, Key=key)["Body"].read()
+        except Exception as e:
+            logger.error(f"Failed to download '{key}' from S3: {e}")
+            raise AirflowException(f"Failed to download '{key}' from S3: {e}")
 
+    # Downloads are network-bound, so overlap them across threads and parse serially afterwards
+    matching_keys = [key for key in keys if key.lower().endswith(extensions)]
+    with ThreadPoolExecutor(max_workers=config.get("max_workers", MAX_DOWNLOAD_WORKERS)) as executor:
+        downloads = list(executor.map(fetch, matching_keys))
+
+    data_dict = {}
+
+    for key, raw in downloads:
         file_name = key.split("/")[-1]
         file_key, ext = file_name.rsplit(".", 1)
         ext = ext.lower()
 
         try:
-            file_obj = s3_hook.get_key(key, bucket_name=bucket)
-            content = file_obj.get()['Body'].read().decode("utf-8")
-
             if ext == "csv":
-                df = pd.read_csv(StringIO(content))
+                table = pacsv.read_csv(
+                    pa.BufferReader(raw),
+                    read_options=pacsv.ReadOptions(use_threads=True, block_size=8 << 20),
+                    convert_options=pacsv.ConvertOptions(strings_can_be_null=True)
+                )
+                df = table.to_pandas(self_destruct=True)
             elif ext == "json":
-                df = pd.read_json(StringIO(content), orient="records")
+                df = pd.DataFrame.from_records(orjson.loads(raw))
             else:
                 logger.warning(f"Unsupported file extension '{ext}' for file '{file_name}', skipping.")
                 continue
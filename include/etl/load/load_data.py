@@ -1,23 +1,78 @@
+import os
+import logging
+import tempfile
 import pandas as pd
 
 from airflow.providers.snowflake.hooks.snowflake import SnowflakeHook
+from include.etl.load.snowflake_sql import make_stage_path, parquet_load_statements
+from include.etl.transformations.generate_product_sales_performance import performance_tier_case_sql
+
+logger = logging.getLogger(__name__)
 
 
 def load_data_to_snowflake(df: pd.DataFrame, database: str, schema: str, table: str) -> None:
     """
-    Load data to snowflake tables
+    Load data to snowflake tables.
+    The DataFrame is written once as Parquet, PUT to the user stage, and the target table is recreated
+    from the file's inferred schema and filled with a single COPY INTO, regardless of row count.
     """
     if df.empty:
         raise ValueError("Empty Dataframe")
 
+    target = f"{database}.{schema}.{table}"
+    stage_path = make_stage_path(database, schema, table)
+
+    snowflake_hook = SnowflakeHook(snowflake_conn_id="my_snowflake_conn")
+    conn = snowflake_hook.get_conn()
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir, conn.cursor() as cursor:
+            file_path = os.path.join(tmp_dir, f"{table}.parquet")
+            df.to_parquet(
+                file_path,
+                engine="pyarrow",
+                compression="snappy",
+                index=False,
+                coerce_timestamps="us",
+                allow_truncated_timestamps=True,
+            )
+
+            for statement in parquet_load_statements(file_path, database, schema, table, stage_path):
+                cursor.execute(statement)
+    finally:
+        conn.close()
+
+    logger.info(f"Loaded {len(df)} rows to {target}")
+
+
+def create_product_sales_performance_table(database: str, source_schema: str, source_table: str,
+                                           schema: str, table: str) -> None:
+    """
+    Build the product sales performance table inside Snowflake from the loaded merged sales and products table.
+    Performance tiers come from the same revenue bins as generate_product_sales_performance.
+    """
+    sql = f"""
+        CREATE OR REPLACE TABLE {database}.{schema}.{table} AS
+        SELECT
+            product_id,
+            category,
+            brand,
+            total_revenue,
+            total_units_sold,
+            average_rating,
+            {performance_tier_case_sql('total_revenue')} AS performance_tier
+        FROM (
+            SELECT
+                product_id,
+                category,
+                brand,
+                SUM(total_sales) AS total_revenue,
+                SUM(quantity) AS total_units_sold,
+                AVG(rating) AS average_rating
+            FROM {database}.{source_schema}.{source_table}
+            GROUP BY product_id, category, brand
+        )
+    """
+
     snowflake_hook = SnowflakeHook(snowflake_conn_id="my_snowflake_conn")
-    engine = snowflake_hook.get_sqlalchemy_engine()
-
-    df.to_sql(
-        name=table,
-        con=engine,
-        schema=schema,
-        index=False,
-        if_exists="replace",
-        method="multi",
-    )
\ No newline at end of file
+    snowflake_hook.run(sql)
@@ -0,0 +1,47 @@
+import uuid
+from typing import List, Optional
+
+PARQUET_FILE_FORMAT = "retail_etl_parquet"
+
+
+def make_stage_path(database: str, schema: str, table: str, load_id: Optional[str] = None) -> str:
+    """
+    Return a user-stage directory unique to one load of a table.
+    The trailing slash and per-load subdirectory keep prefix-matched statements away from sibling tables
+    (e.g. sales vs. sales_data) and from parallel loads of the same table.
+    """
+    if load_id is None:
+        load_id = uuid.uuid4().hex
+    return f"@~/retail_etl/{database}/{schema}/{table}/{load_id}/"
+
+
+def parquet_load_statements(file_path: str, database: str, schema: str, table: str, stage_path: str) -> List[str]:
+    """
+    Build the statements that stage a local Parquet file, recreate the target table from its inferred schema
+    and copy the staged file into it.
+    """
+    target = f"{database}.{schema}.{table}"
+    file_format = f"{database}.{schema}.{PARQUET_FILE_FORMAT}"
+
+    return [
+        f"CREATE TEMPORARY FILE FORMAT IF NOT EXISTS {file_format} TYPE = PARQUET USE_LOGICAL_TYPE = TRUE",
+        f"PUT 'file://{file_path}' {stage_path} OVERWRITE = TRUE AUTO_COMPRESS = FALSE",
+        # Upper-case inferred column names so the table's identifiers stay case-insensitive
+        f"""
+            CREATE OR REPLACE TABLE {target} USING TEMPLATE (
+                SELECT ARRAY_AGG(OBJECT_CONSTRUCT(
+                    'COLUMN_NAME', UPPER(COLUMN_NAME),
+                    'TYPE', TYPE,
+                    'NULLABLE', NULLABLE
+                )) WITHIN GROUP (ORDER BY ORDER_ID)
+                FROM TABLE(INFER_SCHEMA(LOCATION => '{stage_path}', FILE_FORMAT => '{file_format}'))
+            )
+        """,
+        f"""
+            COPY INTO {target}
+            FROM {stage_path}
+            FILE_FORMAT = (FORMAT_NAME = '{file_format}')
+            MATCH_BY_COLUMN_NAME = CASE_INSENSITIVE
+            PURGE = TRUE
+        """,
+    ]
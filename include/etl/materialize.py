@@ -0,0 +1,73 @@
+import os
+import time
+import shutil
+import logging
+import functools
+import pandas as pd
+from typing import Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def materialize(df: pd.DataFrame, name: str, folder: str) -> str:
+    """
+    Write a DataFrame to a Parquet file in a run-scoped folder and return its path.
+    Lets Airflow tasks pass intermediates by path instead of pickling full DataFrames through XCom.
+    """
+    os.makedirs(folder, exist_ok=True)
+    path = os.path.join(folder, f"{name}.parquet")
+
+    df.to_parquet(path, engine="pyarrow", compression="zstd", index=False)
+
+    logger.info(f"Materialized {name} to {path} (rows: {len(df)})")
+    return path
+
+
+def read_materialized(path: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Read a materialized Parquet intermediate, loading only the requested columns.
+    """
+    if not os.path.exists(path):
+        logger.error(f"Materialized file not found: {path}")
+        raise FileNotFoundError(f"Materialized file does not exist: {path}")
+
+    # Parquet metadata records only "string", so pin the storage to keep string[pyarrow] columns Arrow-backed
+    with pd.option_context("mode.string_storage", "pyarrow"):
+        df = pd.read_parquet(path, engine="pyarrow", columns=columns)
+
+    logger.info(f"Read {path} (rows: {len(df)}, columns: {list(df.columns)})")
+    return df
+
+
+def expire_run_folders(root: str, max_age_hours: float, now: Optional[float] = None) -> List[str]:
+    """
+    Remove run folders under root that were last modified more than max_age_hours ago and return their paths.
+    Recent folders, including those of failed runs awaiting a retry, are left in place.
+    """
+    if not os.path.isdir(root):
+        return []
+
+    cutoff = (time.time() if now is None else now) - max_age_hours * 3600
+    expired = []
+    for entry in os.scandir(root):
+        if entry.is_dir(follow_symlinks=False) and entry.stat().st_mtime < cutoff:
+            shutil.rmtree(entry.path, ignore_errors=True)
+            expired.append(entry.path)
+
+    logger.info(f"Expired {len(expired)} run folder(s) under {root}")
+    return expired
+
+
+def reads_columns(columns: List[str]) -> Callable:
+    """
+    Let a transformer accept either a DataFrame or a path to a materialized Parquet file as its first argument.
+    Paths are read with only the given columns, so each consumer loads just the column chunks it needs.
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(df, *args, **kwargs):
+            if isinstance(df, str):
+                df = read_materialized(df, columns=columns)
+            return func(df, *args, **kwargs)
+        return wrapper
+    return decorator
@@ -1,34 +1,36 @@
+import numpy as np
 import pandas as pd
 import logging
 
 from include.validations.revenue_concentration_schema import validate_output_revenue_concentration_schema
-from include.etl.transformations.helpers import validate_required_columns, calculate_percentage_share
+from include.etl.transformations.helpers import validate_required_columns
+from include.etl.materialize import reads_columns
 
 logger = logging.getLogger(__name__)
 
+REQUIRED_COLUMNS = ["region", "total_sales"]
 
+
+@reads_columns(REQUIRED_COLUMNS)
 def analyze_revenue_concentration_by_region(enriched_df: pd.DataFrame) -> pd.DataFrame:
     """
     Analyzing revenue concentration and inequality by region.
     """
     logger.info("Analyzing revenue concentration by region.")
 
-    required_cols = ["region", "total_sales"]
-    validate_required_columns(enriched_df, required_cols, "revenue concentration analysis")
+    validate_required_columns(enriched_df, REQUIRED_COLUMNS, "revenue concentration analysis")
 
     region_df = (
         enriched_df
-        .groupby("region", as_index=False)["total_sales"]
+        .groupby("region", as_index=False, observed=True, sort=False)["total_sales"]
         .sum()
         .sort_values(by="total_sales", ascending=False)
     )
 
-    region_df = calculate_percentage_share(
-        region_df,
-        value_col="total_sales",
-        share_col="revenue_share",
-        cumulative_col="cumulative_share"
-    )
+    sales = region_df["total_sales"].to_numpy()
+    total = sales.sum()
+    region_df["revenue_share"] = sales / total
+    region_df["cumulative_share"] = np.cumsum(sales) / total
 
     logger.info("Revenue concentration analysis complete.")
     return validate_output_revenue_concentration_schema(region_df)
\ No newline at end of file
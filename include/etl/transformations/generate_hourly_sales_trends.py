@@ -3,33 +3,38 @@ import logging
 
 from include.validations.sales_trends_schema import validate_output_sales_trends_schema
 from include.etl.transformations.helpers import validate_required_columns
+from include.etl.materialize import reads_columns
 
 logger = logging.getLogger(__name__)
 
+REQUIRED_COLUMNS = ["region", "category", "hour", "total_sales"]
 
+
+@reads_columns(REQUIRED_COLUMNS)
 def generate_hourly_sales_trends(merged_df: pd.DataFrame) -> pd.DataFrame:
     """
     Analyzing hourly sales trends to identify the peak sales hour for each region and category.
     """
     logger.info("Generating hourly sales trends by region and category.")
 
-    required_columns = ["region", "category", "hour", "total_sales"]
-    validate_required_columns(merged_df, required_columns, "hourly sales trends")
+    validate_required_columns(merged_df, REQUIRED_COLUMNS, "hourly sales trends")
 
     grouped = (
         merged_df
-        .groupby(["region", "category", "hour"], as_index=False)["total_sales"]
+        .groupby(["region", "category", "hour"], as_index=False, observed=True, sort=False)["total_sales"]
         .sum()
     )
 
+    # First row per (region, category) after sorting by sales descending is its peak hour; ties go to the lowest hour
     peak_trends_df = (
-        grouped.sort_values(["region", "category", "total_sales"], ascending=[True, True, False])
-        .groupby(["region", "category"], as_index=False)
-        .first()
+        grouped.sort_values(["total_sales", "hour"], ascending=[False, True])
+        .drop_duplicates(subset=["region", "category"], keep="first")
+        .sort_values(["region", "category"])
+        .reset_index(drop=True)
         .rename(columns={
             "hour": "peak_hour",
             "total_sales": "max_sales"
-        })
+        }, copy=False)
     )
 
     logger.info(f"Generated {len(peak_trends_df)} peak trend rows.")
@@ -1,35 +1,57 @@
+import numpy as np
 import pandas as pd
 import logging
 
 from include.validations.product_performance_schema import validate_output_product_performance_schema
 from include.etl.transformations.helpers import validate_required_columns
+from include.etl.materialize import reads_columns
 
 logger = logging.getLogger(__name__)
 
+REQUIRED_COLUMNS = ["product_id", "quantity", "total_sales", "category", "brand", "rating"]
 
+# Upper revenue bounds (inclusive) of each tier except the last, matching bins (0, 20000], (20000, 50000], (50000, inf)
+PERFORMANCE_TIER_EDGES = np.array([20000.0, 50000.0])
+PERFORMANCE_TIER_LABELS = ["Low Performer", "Average", "Bestseller"]
+
+
+def performance_tier_case_sql(revenue_col: str = "total_revenue") -> str:
+    """
+    Build the SQL CASE expression assigning the same performance tiers as generate_product_sales_performance.
+    """
+    lower_bounds = [0.0, *PERFORMANCE_TIER_EDGES]
+    whens = [
+        f"WHEN {revenue_col} > {bound:g} THEN '{label}'"
+        for bound, label in reversed(list(zip(lower_bounds, PERFORMANCE_TIER_LABELS)))
+    ]
+    return "CASE " + " ".join(whens) + " END"
+
+
+@reads_columns(REQUIRED_COLUMNS)
 def generate_product_sales_performance(merged_df: pd.DataFrame) -> pd.DataFrame:
     """
     Generating product sales ranking and performance categorization based on revenue and sales volume.
     """
     logger.info("Generating product sales performance data.")
 
-    required_columns = ["product_id", "quantity", "total_sales", "category", "brand", "rating"]
-    validate_required_columns(merged_df, required_columns, "product sales performance")
+    validate_required_columns(merged_df, REQUIRED_COLUMNS, "product sales performance")
 
     performance_df = (
         merged_df
-        .groupby(["product_id", "category", "brand"], as_index=False)
+        .groupby(["product_id", "category", "brand"], as_index=False, observed=True, sort=False)
         .agg(
             total_revenue=("total_sales", "sum"),
             total_units_sold=("quantity", "sum"),
             average_rating=("rating", "mean")
         )
+        .astype({"total_units_sold": "int64", "average_rating": "float64"})
     )
 
-    performance_df["performance_tier"] = pd.cut(
-        performance_df["total_revenue"],
-        bins=[0, 20000, 50000, float("inf")],
-        labels=["Low Performer", "Average", "Bestseller"]
+    revenue = performance_df["total_revenue"].to_numpy()
+    tier_codes = np.searchsorted(PERFORMANCE_TIER_EDGES, revenue, side="left")
+    tier_codes = np.where(revenue > 0, tier_codes, -1)  # non-positive revenue falls outside every tier
+    performance_df["performance_tier"] = pd.Categorical.from_codes(
+        tier_codes, categories=PERFORMANCE_TIER_LABELS, ordered=True
     )
 
     logger.info(f"Generated performance data for {len(performance_df)} products.")
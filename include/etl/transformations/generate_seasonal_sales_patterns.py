@@ -1,25 +1,40 @@
+import numpy as np
 import pandas as pd
 import logging
 
 from include.validations.seasonal_sales_schema import validate_output_seasonal_sales_schema
 from include.etl.transformations.helpers import validate_required_columns
+from include.etl.materialize import reads_columns
 
 logger = logging.getLogger(__name__)
 
+REQUIRED_COLUMNS = ["timestamp", "category", "total_sales"]
 
+
+@reads_columns(REQUIRED_COLUMNS)
 def generate_seasonal_sales_patterns(enriched_df: pd.DataFrame) -> pd.DataFrame:
     """
     Generating seasonal sales trends by quarter and product category.
     """
     logger.info("Generating seasonal sales patterns by quarter and category.")
 
-    required_cols = ["timestamp", "category", "total_sales"]
-    validate_required_columns(enriched_df, required_cols, "seasonal sales patterns")
+    validate_required_columns(enriched_df, REQUIRED_COLUMNS, "seasonal sales patterns")
+
+    # Encode each row's quarter as an integer and only format the distinct quarters as "YYYYQn" labels.
+    # NaT rows get code -1, so like to_period("Q") they have no quarter and drop out of the groupby
+    timestamps = enriched_df["timestamp"]
+    valid = timestamps.notna().to_numpy()
+    years = timestamps.dt.year.to_numpy()[valid].astype("int64")
+    months = timestamps.dt.month.to_numpy()[valid].astype("int64")
+    valid_codes, quarter_keys = pd.factorize(years * 4 + (months - 1) // 3)
+    quarter_codes = np.full(len(timestamps), -1, dtype=valid_codes.dtype)
+    quarter_codes[valid] = valid_codes
+    quarter_labels = [f"{key // 4}Q{key % 4 + 1}" for key in quarter_keys]
 
     seasonal_df = (
         enriched_df
-        .assign(quarter=enriched_df["timestamp"].dt.to_period("Q").astype(str))
-        .groupby(["quarter", "category"], as_index=False)
+        .assign(quarter=pd.Categorical.from_codes(quarter_codes, categories=quarter_labels))
+        .groupby(["quarter", "category"], as_index=False, observed=True, sort=False)
         .agg(
             total_sales=("total_sales", "sum"),
             order_count=("total_sales", "size")  # counts rows = orders
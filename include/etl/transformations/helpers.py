@@ -2,11 +2,16 @@
 Helper functions for ETL operations.
 """
 import logging
+import numpy as np
 import pandas as pd
-from typing import List, Dict, Any, Optional, Union
+import pyarrow as pa
+import pyarrow.compute as pc
+from typing import List, Dict, Any, Optional, Union, Iterable, Tuple
 
 logger = logging.getLogger(__name__)
 
+WEEKDAY_NAMES = np.array(["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"], dtype=object)
+
 
 def standardize_column_names(df: pd.DataFrame, rename_map: Dict[str, str] = None) -> pd.DataFrame:
     """
@@ -16,51 +21,69 @@ def standardize_column_names(df: pd.DataFrame, rename_map: Dict[str, str] = None
     if rename_map:
         df = df.rename(columns=rename_map)
 
-    df.columns = (
-        df.columns
-        .astype(str)
-        .str.strip()
-        .str.lower()
-        .str.replace(r'\s+', '_', regex=True)
-    )
+    df.columns = ["_".join(str(col).split()).lower() for col in df.columns]
     return df
 
 
+def to_arrow_strings(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+    """
+    Convert object columns to Arrow-backed strings so string kernels run in pyarrow.compute.
+    """
+    df_copy = df.copy(deep=False)
+
+    for col in columns:
+        if col in df_copy.columns and pd.api.types.is_object_dtype(df_copy[col].dtype):
+            df_copy[col] = df_copy[col].astype("string[pyarrow]")
+
+    return df_copy
+
+
+def _as_string_series(series: pd.Series) -> pd.Series:
+    # Already-string columns are used as-is; anything else becomes a StringArray, which keeps NA instead of "nan"
+    if pd.api.types.is_string_dtype(series):
+        return series
+    return series.astype("string")
+
+
 def clean_string_columns(df: pd.DataFrame, columns: Union[List[str], Dict[str, str]],
                          case: str = "lower") -> pd.DataFrame:
     """
     Clean string columns by stripping whitespace and normalizing case.
     """
-    df_copy = df.copy()
+    df_copy = df.copy(deep=False)
 
     if isinstance(columns, dict):
         for col, col_case in columns.items():
             if col in df_copy.columns:
-                series = df_copy[col].astype(str).str.strip()
+                series = _as_string_series(df_copy[col]).str.strip()
                 if col_case == "lower":
                     series = series.str.lower()
                 elif col_case == "upper":
                     series = series.str.upper()
-                df_copy.loc[:, col] = series
+                df_copy[col] = series
     else:
         for col in columns:
             if col in df_copy.columns:
-                series = df_copy[col].astype(str).str.strip()
+                series = _as_string_series(df_copy[col]).str.strip()
                 if case == "lower":
                     series = series.str.lower()
                 elif case == "upper":
                     series = series.str.upper()
-                df_copy.loc[:, col] = series
+                df_copy[col] = series
 
     return df_copy
 
 
-def validate_required_columns(df: pd.DataFrame, required_cols: List[str],
+def validate_required_columns(df: pd.DataFrame, required_cols: Iterable[str],
                               operation_name: str = "operation") -> None:
     """
     Validate that all required columns are present in the DataFrame.
     """
-    missing = [col for col in required_cols if col not in df.columns]
+    present = frozenset(df.columns)
+    if present.issuperset(required_cols):
+        return
+
+    missing = [col for col in required_cols if col not in present]
     if missing:
         logger.error(f"Missing required columns for {operation_name}: {missing}")
         raise ValueError(f"Missing required columns for {operation_name}: {missing}")
@@ -69,33 +92,55 @@ def validate_required_columns(df: pd.DataFrame, required_cols: List[str],
 def filter_positive_values(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
     """
     Filter DataFrame to keep only rows with positive values in specified columns.
-    Uses .loc and returns a copy to avoid SettingWithCopyWarning.
+    Copy-on-Write keeps the filtered frame independent of the input without an explicit copy.
     """
-    condition = pd.Series(True, index=df.index)
+    present = [col for col in columns if col in df.columns]
     for col in columns:
-        if col in df.columns:
-            condition &= df[col] > 0
-        else:
+        if col not in df.columns:
             logger.warning(f"Column {col} not found for positive value filtering")
 
-    filtered_df = df.loc[condition].copy()
+    if not present:
+        return df
+
+    condition = np.logical_and.reduce([df[col].to_numpy() > 0 for col in present])
+    filtered_df = df.loc[condition]
     logger.info(f"Filtered to {len(filtered_df)} rows with positive values in {columns}")
     return filtered_df
 
 
+def _is_arrow_string_dtype(dtype) -> bool:
+    if isinstance(dtype, pd.StringDtype):
+        return dtype.storage == "pyarrow"
+    if isinstance(dtype, pd.ArrowDtype):
+        return pa.types.is_string(dtype.pyarrow_dtype) or pa.types.is_large_string(dtype.pyarrow_dtype)
+    return False
+
+
 def safe_datetime_conversion(df: pd.DataFrame, column: str, datetime_format: str = None,
-                             errors: str = 'coerce') -> pd.DataFrame:
+                             errors: str = 'coerce', exact: bool = True, cache: bool = True) -> pd.DataFrame:
     """
     Safely convert a column to datetime.
+    Arrow-backed string columns with a known format are parsed with pyarrow.compute.strptime.
     """
-    df_copy = df.copy()
+    df_copy = df.copy(deep=False)
 
     if column in df_copy.columns:
         try:
-            if datetime_format:
-                df_copy[column] = pd.to_datetime(df_copy[column], format=datetime_format, errors=errors)
+            series = df_copy[column]
+            if datetime_format and exact and errors in ("coerce", "raise") and _is_arrow_string_dtype(series.dtype):
+                values = pa.array(series)
+                # strptime skips leading whitespace that pandas' exact match rejects, so treat those values as unparseable
+                padded = pc.match_substring_regex(values, r"^\s")
+                if errors == "raise" and pc.any(padded).as_py():
+                    raise ValueError(f"Values in {column} do not match format {datetime_format}")
+                parsed = pc.strptime(pc.if_else(padded, pa.scalar(None, values.type), values), format=datetime_format,
+                                     unit="ns", error_is_null=errors == "coerce")
+                df_copy[column] = pd.Series(np.asarray(parsed), index=df_copy.index)
+            elif datetime_format:
+                df_copy[column] = pd.to_datetime(series, format=datetime_format, errors=errors,
+                                                 exact=exact, cache=cache)
             else:
-                df_copy[column] = pd.to_datetime(df_copy[column], errors=errors)
+                df_copy[column] = pd.to_datetime(series, errors=errors, cache=cache)
 
             logger.info(f"Successfully converted {column} to datetime")
         except Exception as e:
@@ -107,15 +152,30 @@ def safe_datetime_conversion(df: pd.DataFrame, column: str, datetime_format: str
     return df_copy
 
 
+def key_stats(series: pd.Series) -> Dict[str, int]:
+    """
+    Compute null, unique and duplicate counts for a join key from a single value_counts pass.
+    """
+    counts = series.value_counts(dropna=False, sort=False)
+    null_mask = counts.index.isna()
+
+    return {
+        "null_count": int(counts.to_numpy()[null_mask].sum()),
+        "unique_count": int((~null_mask).sum()),
+        "duplicate_count": len(series) - len(counts),
+    }
+
+
 def validate_dataframes_for_merge(
         left_df: pd.DataFrame,
         right_df: pd.DataFrame,
         join_key: str,
         left_name: str = "left",
         right_name: str = "right"
-) -> None:
+) -> Tuple[Dict[str, int], Dict[str, int]]:
     """
     Generic validation for DataFrame merge operations.
+    Returns the join key stats of both sides so later merge diagnostics can reuse them.
     """
     if left_df.empty:
         raise ValueError(f"{left_name.capitalize()} DataFrame is empty")
@@ -127,36 +187,39 @@ def validate_dataframes_for_merge(
     if join_key not in right_df.columns:
         raise ValueError(f"Missing '{join_key}' column in {right_name} DataFrame")
 
-    left_null_count = left_df[join_key].isnull().sum()
-    right_null_count = right_df[join_key].isnull().sum()
+    left_stats = key_stats(left_df[join_key])
+    right_stats = key_stats(right_df[join_key])
+    left_null_count = left_stats["null_count"]
+    right_null_count = right_stats["null_count"]
 
     if left_null_count > 0:
         logger.warning(f"Found {left_null_count} null {join_key} values in {left_name} data")
     if right_null_count > 0:
         logger.warning(f"Found {right_null_count} null {join_key} values in {right_name} data")
 
+    return left_stats, right_stats
+
 
 def check_merge_compatibility(
         left_df: pd.DataFrame,
         right_df: pd.DataFrame,
         join_key: str,
-        right_name: str = "right"
+        right_name: str = "right",
+        right_stats: Optional[Dict[str, int]] = None
 ) -> None:
     """
     Check for potential issues with merge operation.
     """
-    duplicate_count = right_df[join_key].duplicated().sum()
+    duplicate_count = (right_stats or key_stats(right_df[join_key]))["duplicate_count"]
     if duplicate_count > 0:
         logger.error(f"Found {duplicate_count} duplicate {join_key} values in {right_name} DataFrame")
         raise ValueError(f"{right_name.capitalize()} DataFrame contains duplicate {join_key} values")
 
-    left_keys = set(left_df[join_key].dropna())
-    right_keys = set(right_df[join_key].dropna())
-
-    missing_keys = left_keys - right_keys
-    if missing_keys:
+    left_keys = left_df[join_key].dropna()
+    missing_keys = left_keys[~left_keys.isin(right_df[join_key])].unique()
+    if len(missing_keys):
         logger.warning(f"Found {len(missing_keys)} {join_key} values in left that don't exist in {right_name}")
-        sample_missing = list(missing_keys)[:5]
+        sample_missing = missing_keys[:5].tolist()
         logger.warning(f"Sample missing {join_key} values: {sample_missing}")
 
 
@@ -165,25 +228,30 @@ def analyze_merge_quality(
         right_df: pd.DataFrame,
         merged_df: pd.DataFrame,
         join_key: str,
-        left_id_col: Optional[str] = None
+        left_id_col: Optional[str] = None,
+        left_stats: Optional[Dict[str, int]] = None,
+        right_stats: Optional[Dict[str, int]] = None
 ) -> dict:
     """
     Analyze the quality and completeness of merge operation.
     """
+    left_stats = left_stats or key_stats(left_df[join_key])
+    right_stats = right_stats or key_stats(right_df[join_key])
+
     analysis = {
         "input_left_count": len(left_df),
         "input_right_count": len(right_df),
         "output_merged_count": len(merged_df),
         "merge_ratio": len(merged_df) / len(left_df) * 100 if len(left_df) > 0 else 0,
-        "unique_keys_in_left": left_df[join_key].nunique(),
-        "unique_keys_in_right": right_df[join_key].nunique(),
+        "unique_keys_in_left": left_stats["unique_count"],
+        "unique_keys_in_right": right_stats["unique_count"],
         "keys_successfully_merged": merged_df[join_key].nunique()
     }
 
     if left_id_col and left_id_col in left_df.columns and left_id_col in merged_df.columns:
-        merged_ids = set(merged_df[left_id_col])
-        original_ids = set(left_df[left_id_col])
-        analysis["lost_records_count"] = len(original_ids - merged_ids)
+        original_ids = left_df[left_id_col]
+        lost_ids = original_ids[~original_ids.isin(merged_df[left_id_col])]
+        analysis["lost_records_count"] = lost_ids.nunique(dropna=False)
 
     return analysis
 
@@ -206,35 +274,25 @@ def filter_valid_categorical_values(df: pd.DataFrame, column: str,
     return filtered_df
 
 
-def add_temporal_features(df: pd.DataFrame, timestamp_col: str) -> pd.DataFrame:
+def temporal_feature_arrays(ts: np.ndarray) -> Dict[str, np.ndarray]:
     """
-    Add common temporal features from a timestamp column.
+    Compute month, weekday and hour arrays from a datetime64[ns] array.
     """
-    if timestamp_col not in df.columns:
-        logger.error(f"Timestamp column {timestamp_col} not found")
-        raise ValueError(f"Timestamp column {timestamp_col} not found")
-
-    df_copy = df.copy()
-
-    df_copy["month"] = df_copy[timestamp_col].dt.to_period('M').astype(str)
-    df_copy["weekday"] = df_copy[timestamp_col].dt.day_name()
-    df_copy["hour"] = df_copy[timestamp_col].dt.hour.astype('int64')
-
-    logger.info(f"Added temporal features from {timestamp_col}")
+    month = np.datetime_as_string(ts.astype("datetime64[M]"), unit="M")
+    # 1970-01-01 was a Thursday, so shifting day numbers by 3 puts Monday at index 0
+    weekday = WEEKDAY_NAMES[(ts.astype("datetime64[D]").view("int64") + 3) % 7]
+    weekday[np.isnat(ts)] = None
+    hour = ts.astype("datetime64[h]").view("int64") % 24
 
-    return df_copy
+    return {"month": month, "weekday": weekday, "hour": hour}
 
 
-def create_sales_buckets(df: pd.DataFrame, sales_col: str,
-                           bins: List[float] = None,
-                           labels: List[str] = None) -> pd.DataFrame:
+def sales_bucket_array(values: Union[pd.Series, np.ndarray],
+                       bins: List[float] = None,
+                       labels: List[str] = None) -> np.ndarray:
     """
-    Create revenue/sales buckets from a continuous revenue column.
+    Assign each sales value to a labelled bucket.
     """
-    if sales_col not in df.columns:
-        logger.error(f"Sales column '{sales_col}' not found")
-        raise ValueError(f"Sales column '{sales_col}' not found")
-
     # Default bins and labels
     if bins is None:
         bins = [0, 100, 500, float("inf")]
@@ -245,18 +303,13 @@ def create_sales_buckets(df: pd.DataFrame, sales_col: str,
     if len(labels) != len(bins) - 1:
         raise ValueError(f"Number of labels ({len(labels)}) must be one less than number of bins ({len(bins)})")
 
-    df_copy = df.copy()
-
-    df_copy["sales_bucket"] = pd.cut(
-        df_copy[sales_col],
-        bins=bins,
-        labels=labels,
-        include_lowest=True
-    ).astype(str)
+    arr = np.asarray(values, dtype="float64")
+    edges = np.asarray(bins, dtype="float64")
 
-    logger.info(f"Created sales_bucket from '{sales_col}' with {len(labels)} categories")
-
-    return df_copy
+    # side="left" keeps the bins right-closed like pd.cut, and the lowest edge is included
+    buckets = np.asarray(labels, dtype=object)[np.searchsorted(edges[1:-1], arr, side="left")]
+    buckets[~((arr >= edges[0]) & (arr <= edges[-1]))] = "nan"
+    return buckets
 
 
 def log_dataframe_info(df: pd.DataFrame, operation_name: str,
@@ -270,40 +323,3 @@ def log_dataframe_info(df: pd.DataFrame, operation_name: str,
         logger.info(f"{operation_name} - Preview:\n{df.head(preview_rows).to_string(index=False)}")
 
     logger.info(f"{operation_name} - Data types:\n{df.dtypes}")
-
-
-def calculate_percentage_share(
-        df: pd.DataFrame,
-        value_col: str,
-        group_cols: List[str] = None,
-        share_col: str = "share",
-        cumulative_col: str = "cumulative_share"
-) -> pd.DataFrame:
-    """
-    Calculate percentage share and cumulative share for a value column.
-    """
-    if value_col not in df.columns:
-        logger.error(f"Value column {value_col} not found")
-        raise ValueError(f"Value column {value_col} not found")
-
-    df_copy = df.copy()
-
-    if group_cols:
-        total = df_copy.groupby(group_cols)[value_col].transform('sum')
-    else:
-        total = df_copy[value_col].sum()
-
-    df_copy[share_col] = df_copy[value_col] / total
-
-    if group_cols:
-        df_copy[cumulative_col] = (
-            df_copy.groupby(group_cols)[share_col].cumsum()
-        )
-    else:
-        df_copy = df_copy.sort_values(by=value_col, ascending=False)
-        df_copy[cumulative_col] = df_copy[share_col].cumsum()
-
-    logger.info(f"Added percentage shares for {value_col} "
-                f"(columns: {share_col}, {cumulative_col})")
-
-    return df_copy
@@ -17,15 +17,22 @@ def merge_sales_and_products(sales_df: pd.DataFrame, products_df: pd.DataFrame)
     """
     logger.info("Starting merge of sales and products data")
 
-    validate_dataframes_for_merge(sales_df, products_df, "product_id", "sales", "products")
-    check_merge_compatibility(sales_df, products_df, "product_id", "products")
-
-    logger.info(f"Sales DataFrame: {len(sales_df)} rows, {sales_df['product_id'].nunique()} unique products")
-    logger.info(f"Products DataFrame: {len(products_df)} rows, {products_df['product_id'].nunique()} unique products")
-
-    merged_df = sales_df.merge(products_df, on="product_id", how="inner", validate="m:1")
-
-    quality_analysis = analyze_merge_quality(sales_df, products_df, merged_df, "product_id", "sales_id")
+    # Each join key is scanned once here and the counts are shared across the merge diagnostics
+    sales_stats, products_stats = validate_dataframes_for_merge(sales_df, products_df, "product_id", "sales", "products")
+    check_merge_compatibility(sales_df, products_df, "product_id", "products", right_stats=products_stats)
+
+    logger.info(f"Sales DataFrame: {len(sales_df)} rows, {sales_stats['unique_count']} unique products")
+    logger.info(f"Products DataFrame: {len(products_df)} rows, {products_stats['unique_count']} unique products")
+
+    # check_merge_compatibility has already rejected duplicate product_ids, so the indexed join needs no m:1 validation.
+    # Shared non-key columns get merge's default _x/_y suffixes
+    merged_df = (
+        sales_df.join(products_df.set_index("product_id"), on="product_id", how="inner", lsuffix="_x", rsuffix="_y")
+        .reset_index(drop=True)
+    )
+
+    quality_analysis = analyze_merge_quality(sales_df, products_df, merged_df, "product_id", "sales_id",
+                                             left_stats=sales_stats, right_stats=products_stats)
     logger.info(f"Merge completed: {quality_analysis['output_merged_count']} rows "
                 f"({quality_analysis['merge_ratio']:.1f}% of original sales)")
 
@@ -3,42 +3,36 @@ import logging
 
 from include.validations.order_status_schema import validate_output_order_status_schema
 from include.etl.transformations.helpers import validate_required_columns
+from include.etl.materialize import reads_columns
 
 logger = logging.getLogger(__name__)
 
+REQUIRED_COLUMNS = ["timestamp", "order_status"]
+TRACKED_STATUSES = ["pending", "shipped", "returned"]
 
+
+@reads_columns(REQUIRED_COLUMNS)
 def transform_order_status_over_time(enriched_df: pd.DataFrame) -> pd.DataFrame:
     """
     Track how orders move through statuses (“Pending,” “Shipped,” “Returned”) by week.
     """
     logger.info("Starting order status breakdown by week...")
 
-    required_cols = ["timestamp", "order_status"]
-    validate_required_columns(enriched_df, required_cols, "order status over time")
+    validate_required_columns(enriched_df, REQUIRED_COLUMNS, "order status over time")
 
-    enriched_df["week"] = enriched_df["timestamp"].dt.to_period("W").dt.start_time
-
-    grouped = (
-        enriched_df.groupby(["week", "order_status"])
-        .size()
-        .reset_index(name="order_count")
-    )
+    week = enriched_df["timestamp"].dt.to_period("W").dt.start_time.rename("week")
 
     pivoted_df = (
-        grouped.pivot(index="week", columns="order_status", values="order_count")
-        .fillna(0)
-        .astype(int)
-        .reset_index()
+        enriched_df.groupby([week, enriched_df["order_status"]], observed=True, sort=False)
+        .size()
+        .unstack(fill_value=0)
+        .sort_index()
+        .reindex(columns=TRACKED_STATUSES, fill_value=0)
+        .astype("int64", copy=False)
+        .rename(columns=str.title)
         .rename_axis(None, axis=1)
+        .reset_index()
     )
 
-    pivoted_df.columns = [col.title() if col != "week" else col for col in pivoted_df.columns]
-
-    for status in ["Pending", "Shipped", "Returned"]:
-        if status not in pivoted_df.columns:
-            pivoted_df[status] = 0
-
-    pivoted_df = pivoted_df[["week", "Pending", "Shipped", "Returned"]]
-
     logger.info("Weekly order status breakdown transformation complete.")
     return validate_output_order_status_schema(pivoted_df)
\ No newline at end of file
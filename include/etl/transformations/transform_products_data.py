@@ -6,29 +6,35 @@ from include.etl.transformations.helpers import (
     standardize_column_names,
     safe_datetime_conversion,
     validate_required_columns,
-    clean_string_columns
+    clean_string_columns,
+    to_arrow_strings
 )
 
 logger = logging.getLogger(__name__)
 
+REQUIRED_COLUMNS = ["product_id", "category", "brand", "rating", "in_stock", "launch_date"]
+
+
 def transform_products_data(products_df: pd.DataFrame) -> pd.DataFrame:
     """
     Applying transformations to the input products DataFrame.
     """
     logger.info("Starting transformation of products data.")
+    now_ts = pd.Timestamp.now()
 
     products_df = standardize_column_names(products_df)
+    products_df = to_arrow_strings(products_df, ["category", "brand"])
     products_df = safe_datetime_conversion(products_df, column="launch_date", errors="coerce")
 
     products_df = validate_input_products_schema(products_df)
 
-    required_cols = ["product_id", "category", "brand", "rating", "in_stock", "launch_date"]
-    validate_required_columns(products_df, required_cols, operation_name="products data transformation")
-    products_df = products_df.dropna(subset=required_cols).copy()
+    validate_required_columns(products_df, REQUIRED_COLUMNS, operation_name="products data transformation")
+    products_df = products_df.dropna(subset=REQUIRED_COLUMNS)
 
     products_df = clean_string_columns(products_df, {"category": "lower", "brand": "upper"})
+    products_df = products_df.astype({"category": "category", "brand": "category"})
 
-    products_df = products_df.drop_duplicates()
+    products_df = products_df.drop_duplicates(subset=["product_id"], keep="first")
 
     logger.info(f"Products transformation complete. Final row count: {len(products_df)}")
-    return validate_output_products_schema(products_df)
\ No newline at end of file
+    return validate_output_products_schema(products_df, now_ts)
\ No newline at end of file
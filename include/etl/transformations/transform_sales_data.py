@@ -1,55 +1,100 @@
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 import logging
 
+from typing import Optional
 from include.validations.sales_schema import validate_input_sales_schema, validate_output_sales_schema
 from include.etl.transformations.helpers import (
     standardize_column_names,
     safe_datetime_conversion,
     validate_required_columns,
-    clean_string_columns
+    to_arrow_strings
 )
 
 logger = logging.getLogger(__name__)
 
+REQUIRED_COLUMNS = ["sales_id", "product_id", "region", "quantity", "price", "timestamp", "order_status"]
+VALID_STATUSES = ["completed", "cancelled", "pending", "returned", "shipped"]
+
+
+def _clean_string(column: pa.ChunkedArray) -> pa.ChunkedArray:
+    return pc.utf8_lower(pc.utf8_trim_whitespace(column))
+
+
+def transform_sales_data_arrow(table: pa.Table, now_ts: Optional[pd.Timestamp] = None) -> pa.Table:
+    """
+    Filter, clean and total standardized sales rows with pyarrow.compute kernels.
+    """
+    if now_ts is None:
+        now_ts = pd.Timestamp.now()
+
+    region = _clean_string(table["region"])
+    order_status = _clean_string(table["order_status"])
+    table = table.set_column(table.schema.get_field_index("region"), "region", region)
+    table = table.set_column(table.schema.get_field_index("order_status"), "order_status", order_status)
+
+    # Collect every row predicate into one mask so the rows are filtered in a single pass. Comparisons yield
+    # null for missing values, which the filter drops, so only the columns without a predicate need is_valid
+    predicates = [pc.is_valid(table[col]) for col in ["sales_id", "product_id", "region"]] + [
+        pc.greater(table["price"], 0),
+        pc.greater(table["quantity"], 0),
+        pc.less_equal(table["timestamp"], pa.scalar(now_ts, type=table["timestamp"].type)),
+        pc.is_in(order_status, value_set=pa.array(VALID_STATUSES, type=order_status.type)),
+    ]
+    keep = predicates[0]
+    for predicate in predicates[1:]:
+        keep = pc.and_kleene(keep, predicate)
+    table = table.filter(keep)
+
+    if "discount" in table.column_names:
+        discount = pc.fill_null(table["discount"].cast(pa.float64()), 0.0)
+        table = table.set_column(table.schema.get_field_index("discount"), "discount", discount)
+    else:
+        discount = pa.array(np.zeros(table.num_rows))
+        table = table.append_column("discount", discount)
+
+    total_sales = pc.multiply(pc.multiply(table["quantity"], table["price"]), pc.subtract(1.0, discount))
+    table = table.append_column("total_sales", total_sales)
+
+    # Keep the first row per sales_id in input order
+    first_rows = (
+        table.select(["sales_id"])
+        .append_column("row", pa.array(np.arange(table.num_rows)))
+        .group_by("sales_id", use_threads=False)
+        .aggregate([("row", "min")])["row_min"]
+    )
+    return table.take(np.sort(first_rows.to_numpy()))
+
 
 def transform_sales_data(sales_df: pd.DataFrame) -> pd.DataFrame:
     """
     Clean and transform raw sales data.
     """
     logger.info("Starting sales data cleaning and transformation...")
+    now_ts = pd.Timestamp.now()
 
     rename_map = {
         "qty": "quantity",
         "Time stamp": "timestamp"
     }
     sales_df = standardize_column_names(sales_df, rename_map)
+    sales_df = to_arrow_strings(sales_df, ["region", "order_status", "timestamp"])
 
-    required_cols = ["sales_id", "product_id", "region", "quantity", "price", "timestamp", "order_status"]
-    validate_required_columns(sales_df, required_cols, operation_name="sales data transformation")
-
-    sales_df = sales_df[(sales_df["price"] > 0) & (sales_df["quantity"] > 0)].copy()
+    validate_required_columns(sales_df, REQUIRED_COLUMNS, operation_name="sales data transformation")
 
     sales_df = safe_datetime_conversion(sales_df, column="timestamp", datetime_format="%d-%m-%y %H:%M", errors="coerce")
-    sales_df = sales_df[sales_df["timestamp"] <= pd.Timestamp.now()].copy()
 
     sales_df = validate_input_sales_schema(sales_df)
 
-    sales_df = sales_df.dropna(subset=required_cols).copy()
-
-    sales_df = clean_string_columns(sales_df, ["region", "order_status"], case="lower")
+    table = transform_sales_data_arrow(pa.Table.from_pandas(sales_df, preserve_index=False), now_ts)
+    sales_df = table.to_pandas(split_blocks=True, self_destruct=True)
+    del table
 
-    valid_statuses = ["completed", "cancelled", "pending", "returned", "shipped"]
-    sales_df = sales_df[sales_df["order_status"].isin(valid_statuses)].copy()
+    sales_df["region"] = sales_df["region"].astype("category")
+    sales_df["order_status"] = pd.Categorical(sales_df["order_status"], categories=VALID_STATUSES)
     logger.info(f"Unique statuses: {sales_df['order_status'].unique()}")
 
-    if "discount" in sales_df.columns:
-        sales_df.loc[:, "discount"] = sales_df["discount"].fillna(0.0)
-    else:
-        sales_df["discount"] = 0.0
-
-    sales_df["total_sales"] = sales_df["quantity"] * sales_df["price"] * (1 - sales_df["discount"])
-
-    sales_df = sales_df.drop_duplicates().copy()
-
     logger.info(f"Cleaning and transformation complete. Final row count: {len(sales_df)}")
-    return validate_output_sales_schema(sales_df)
+    return validate_output_sales_schema(sales_df, now_ts)
@@ -0,0 +1,77 @@
+import os
+import numpy as np
+import pandas as pd
+
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional
+from pandera.errors import SchemaError
+
+
+@dataclass(frozen=True)
+class ColSpec:
+    """
+    Expected dtype, nullability and optional vectorized value check for one column.
+    """
+    dtype: str
+    nullable: bool = True
+    check: Optional[Callable[[np.ndarray], np.ndarray]] = None
+    check_name: str = "check"
+
+
+def strict_validation_enabled() -> bool:
+    """
+    Whether the full Pandera schemas should run instead of the fast kernel.
+    """
+    return bool(os.environ.get("STRICT_VALIDATION"))
+
+
+def _dtype_matches(series: pd.Series, expected: str) -> bool:
+    if expected == "str":
+        return (
+            pd.api.types.is_object_dtype(series.dtype)
+            or pd.api.types.is_string_dtype(series.dtype)
+            or isinstance(series.dtype, pd.CategoricalDtype)
+        )
+    if expected == "datetime64[ns]":
+        return pd.api.types.is_datetime64_dtype(series.dtype)
+    return series.dtype == np.dtype(expected)
+
+
+def _failure_cases(column: str, check: str, series: pd.Series, failed: np.ndarray) -> pd.DataFrame:
+    return pd.DataFrame({
+        "column": column,
+        "check": check,
+        "index": series.index[failed],
+        "failure_case": series.to_numpy()[failed],
+    })
+
+
+def fast_validate(df: pd.DataFrame, specs: Dict[str, ColSpec]) -> pd.DataFrame:
+    """
+    Validate a DataFrame with one vectorized pass per column, raising SchemaError on the first failing column.
+    """
+    for name, spec in specs.items():
+        if name not in df.columns:
+            raise SchemaError(None, df, f"column '{name}' not in dataframe", failure_cases=pd.DataFrame(
+                {"column": [None], "check": ["column_in_dataframe"], "index": [None], "failure_case": [name]}
+            ))
+
+        series = df[name]
+        if not _dtype_matches(series, spec.dtype):
+            raise SchemaError(None, df, f"expected series '{name}' to have type {spec.dtype}, got {series.dtype}",
+                              failure_cases=pd.DataFrame({"column": [name], "check": [f"dtype('{spec.dtype}')"],
+                                                          "index": [None], "failure_case": [str(series.dtype)]}))
+
+        nulls = series.isna().to_numpy()
+        if not spec.nullable and nulls.any():
+            raise SchemaError(None, df, f"non-nullable series '{name}' contains null values",
+                              failure_cases=_failure_cases(name, "not_nullable", series, nulls))
+
+        if spec.check is not None:
+            values = series.to_numpy()
+            failed = ~np.asarray(spec.check(values), dtype=bool) & ~nulls
+            if failed.any():
+                raise SchemaError(None, df, f"series '{name}' failed {spec.check_name}",
+                                  failure_cases=_failure_cases(name, spec.check_name, series, failed))
+
+    return df
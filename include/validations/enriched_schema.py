@@ -11,14 +11,14 @@ output_enrich_schema = pa.DataFrameSchema({
     "sales_id": Column("int64", required=True, nullable=False),
     "product_id": Column("int64", required=True, nullable=False),
     "region": Column(str, required=True, nullable=False),
-    "quantity": Column("int64", required=True, nullable=False),
+    "quantity": Column("int32", required=True, nullable=False),
     "price": Column(float, required=True, nullable=False),
     "timestamp": Column(pa.DateTime, required=True, nullable=False),
     "discount": Column(float, required=True, nullable=True),
     "order_status": Column(str, required=True, nullable=False),
     "category": Column(str, Check(lambda s: s.str.islower()), required=True, nullable=False),
     "brand": Column(str, Check(lambda s: s.str.isupper()), required=True, nullable=False),
-    "rating": Column(float, required=True, nullable=False),
+    "rating": Column("float32", required=True, nullable=False),
     "in_stock": Column(bool, required=True, nullable=False),
     "launch_date": Column(pa.DateTime, required=True, nullable=False),
     "month": Column(str, required=True, nullable=False),
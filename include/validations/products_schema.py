@@ -3,6 +3,7 @@ import pandas as pd
 import pandera.pandas as pa
 
 from pandera.pandas import Column, Check
+from typing import Optional
 from pandera.errors import SchemaError
 
 logger = logging.getLogger(__name__)
@@ -16,14 +17,18 @@ input_products_schema = pa.DataFrameSchema({
     "launch_date": Column(pa.DateTime, nullable=True)
 })
 
-output_products_schema = pa.DataFrameSchema({
-    "product_id": Column(int, Check.greater_than(0), required=True, nullable=False),
-    "category": Column(str, Check(lambda s: s.str.islower()), required=True, nullable=False),
-    "brand": Column(str, Check(lambda s: s.str.isupper().all()), required=True, nullable=False),
-    "rating": Column(float, Check.in_range(0.0, 5.0), required=True, nullable=False),
-    "in_stock": Column(bool, required=True, nullable=False),
-    "launch_date": Column(pa.DateTime, Check.less_than_or_equal_to(pd.Timestamp.today()), required=True, nullable=False),
-})
+def make_output_products_schema(now_ts: pd.Timestamp) -> pa.DataFrameSchema:
+    """
+    Build the output products schema with launch dates bounded by the given run anchor.
+    """
+    return pa.DataFrameSchema({
+        "product_id": Column(int, Check.greater_than(0), required=True, nullable=False),
+        "category": Column(str, Check(lambda s: s.str.islower()), required=True, nullable=False),
+        "brand": Column(str, Check(lambda s: s.str.isupper().all()), required=True, nullable=False),
+        "rating": Column(float, Check.in_range(0.0, 5.0), required=True, nullable=False),
+        "in_stock": Column(bool, required=True, nullable=False),
+        "launch_date": Column(pa.DateTime, Check.less_than_or_equal_to(now_ts), required=True, nullable=False),
+    })
 
 def validate_input_products_schema(df: pd.DataFrame) -> pd.DataFrame:
     """
@@ -38,13 +43,16 @@ def validate_input_products_schema(df: pd.DataFrame) -> pd.DataFrame:
         logger.error("Input schema validation failed.", exc_info=True)
         return df
 
-def validate_output_products_schema(df: pd.DataFrame) -> pd.DataFrame:
+def validate_output_products_schema(df: pd.DataFrame, now_ts: Optional[pd.Timestamp] = None) -> pd.DataFrame:
     """
     Validate processed product DataFrame against the output schema.
     Enforces stricter checks like positive IDs, valid rating range, and launch dates.
     """
+    if now_ts is None:
+        now_ts = pd.Timestamp.now()
+
     try:
-        validated_df = output_products_schema.validate(df)
+        validated_df = make_output_products_schema(now_ts).validate(df)
         logger.info("Output products schema validation succeeded.")
         return validated_df
     except SchemaError as err:
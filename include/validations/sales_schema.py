@@ -1,9 +1,12 @@
 import logging
+import numpy as np
 import pandas as pd
 import pandera.pandas as pa
 
 from pandera.pandas import Column, Check
+from typing import Dict, Optional
 from pandera.errors import SchemaError
+from include.validations._fast import ColSpec, fast_validate, strict_validation_enabled
 
 logger = logging.getLogger(__name__)
 
@@ -20,16 +23,42 @@ input_sales_schema = pa.DataFrameSchema({
 })
 
 
-output_sales_schema = pa.DataFrameSchema({
-    "sales_id": Column(int, Check.greater_than(0), required=True, nullable=False),
-    "product_id": Column(int, Check.greater_than(0), required=True, nullable=False),
-    "region": Column(str, required=True, nullable=False),
-    "quantity": Column(int, Check.greater_than_or_equal_to(0), required=True, nullable=False),
-    "price": Column(float, Check.greater_than_or_equal_to(0), required=True, nullable=False),
-    "timestamp": Column(pa.DateTime, Check.less_than_or_equal_to(pd.Timestamp.now()), required=True, nullable=False),
-    "discount": Column(float, Check.in_range(0.0, 1.0), required=True, nullable=False),
-    "order_status": Column(str, Check.isin(["completed", "cancelled", "pending", "returned", "shipped"]), required=True, nullable=False),
-})
+VALID_ORDER_STATUSES = ["completed", "cancelled", "pending", "returned", "shipped"]
+
+
+def make_output_sales_schema(now_ts: pd.Timestamp) -> pa.DataFrameSchema:
+    """
+    Build the strict output sales schema with timestamps bounded by the given run anchor.
+    """
+    return pa.DataFrameSchema({
+        "sales_id": Column(int, Check.greater_than(0), required=True, nullable=False),
+        "product_id": Column(int, Check.greater_than(0), required=True, nullable=False),
+        "region": Column(str, required=True, nullable=False),
+        "quantity": Column(int, Check.greater_than_or_equal_to(0), required=True, nullable=False),
+        "price": Column(float, Check.greater_than_or_equal_to(0), required=True, nullable=False),
+        "timestamp": Column(pa.DateTime, Check.less_than_or_equal_to(now_ts), required=True, nullable=False),
+        "discount": Column(float, Check.in_range(0.0, 1.0), required=True, nullable=False),
+        "order_status": Column(str, Check.isin(VALID_ORDER_STATUSES), required=True, nullable=False),
+    })
+
+
+def make_output_sales_spec(now_ts: pd.Timestamp) -> Dict[str, ColSpec]:
+    """
+    Build the fast-validation spec mirroring make_output_sales_schema.
+    """
+    now_ns = now_ts.value
+    valid_statuses = np.array(VALID_ORDER_STATUSES, dtype=object)
+    return {
+        "sales_id": ColSpec("int64", nullable=False, check=lambda a: a > 0, check_name="greater_than(0)"),
+        "product_id": ColSpec("int64", nullable=False, check=lambda a: a > 0, check_name="greater_than(0)"),
+        "region": ColSpec("str", nullable=False),
+        "quantity": ColSpec("int64", nullable=False, check=lambda a: a >= 0, check_name="greater_than_or_equal_to(0)"),
+        "price": ColSpec("float64", nullable=False, check=lambda a: a >= 0, check_name="greater_than_or_equal_to(0)"),
+        "timestamp": ColSpec("datetime64[ns]", nullable=False,
+                             check=lambda a: a.view("i8") <= now_ns, check_name=f"less_than_or_equal_to({now_ts})"),
+        "discount": ColSpec("float64", nullable=False, check=lambda a: (a >= 0.0) & (a <= 1.0), check_name="in_range(0.0, 1.0)"),
+        "order_status": ColSpec("str", nullable=False, check=lambda a: np.isin(a, valid_statuses), check_name="isin"),
+    }
 
 
 def validate_input_sales_schema(df: pd.DataFrame) -> pd.DataFrame:
@@ -44,12 +73,17 @@ def validate_input_sales_schema(df: pd.DataFrame) -> pd.DataFrame:
         return df
 
 
-def validate_output_sales_schema(df: pd.DataFrame) -> pd.DataFrame:
+def validate_output_sales_schema(df: pd.DataFrame, now_ts: Optional[pd.Timestamp] = None) -> pd.DataFrame:
     """
     Validate cleaned or transformed sales data against a strict schema.
     """
+    if now_ts is None:
+        now_ts = pd.Timestamp.now()
+
     try:
-        return output_sales_schema.validate(df)
+        if strict_validation_enabled():
+            return make_output_sales_schema(now_ts).validate(df)
+        return fast_validate(df, make_output_sales_spec(now_ts))
     except SchemaError as err:
         logger.error("Output sales schema validation failed.")
         logger.error(err.failure_cases)
@@ -4,6 +4,7 @@ import pandera.pandas as pa
 
 from pandera.pandas import Column, Check
 from pandera.errors import SchemaError
+from include.validations._fast import ColSpec, fast_validate, strict_validation_enabled
 
 logger = logging.getLogger(__name__)
 
@@ -16,12 +17,27 @@ output_seasonal_sales_schema = pa.DataFrameSchema({
 })
 
 
+output_seasonal_sales_spec = {
+    "quarter": ColSpec("str", nullable=False),
+    "category": ColSpec("str", nullable=False),
+    "total_sales": ColSpec("float64", nullable=False),
+    "order_count": ColSpec("int64", nullable=False),
+}
+
+
 def validate_output_seasonal_sales_schema(df: pd.DataFrame) -> pd.DataFrame:
     """
     Validate the seasonal sales pattern DataFrame against the expected schema.
+    Runs the fast column checks first and only falls back to Pandera for the full error report.
     """
+    if not strict_validation_enabled():
+        try:
+            return fast_validate(df, output_seasonal_sales_spec)
+        except SchemaError:
+            pass
+
     try:
-        return output_seasonal_sales_schema.validate(df)
+        return output_seasonal_sales_schema.validate(df, lazy=False, inplace=True)
     except SchemaError as err:
         logger.error("Schema validation failed for seasonal sales patterns.")
         logger.error(err.failure_cases)
@@ -0,0 +1,38 @@
+import pytest
+import pandas as pd
+
+from include.etl.extract import extract_from_local
+from include.etl.extract.extract_from_local import load_folder_to_dict
+
+
+@pytest.fixture
+def data_folder(tmp_path, monkeypatch):
+    """Point the local source folder at an empty temporary directory."""
+    monkeypatch.setitem(extract_from_local.config["local"], "folder", str(tmp_path))
+    return tmp_path
+
+
+def write_csv(folder, filename, sales_ids):
+    pd.DataFrame({"sales_id": sales_ids, "quantity": [1] * len(sales_ids)}).to_csv(folder / filename, index=False)
+
+
+def test_numbered_shards_share_a_key(data_folder):
+    """Files differing only by a numeric suffix are combined under their shared key."""
+    write_csv(data_folder, "sales_data_1.csv", [1, 2])
+    write_csv(data_folder, "sales_data_2.csv", [3])
+
+    data = load_folder_to_dict(str(data_folder))
+
+    assert list(data) == ["sales_data"]
+    assert sorted(data["sales_data"]["sales_id"]) == [1, 2, 3]
+
+
+def test_single_numbered_file_keeps_its_key(data_folder):
+    """A lone file ending in digits is not treated as a shard."""
+    write_csv(data_folder, "sales_data_2025.csv", [1, 2])
+    write_csv(data_folder, "product_data.csv", [7])
+
+    data = load_folder_to_dict(str(data_folder))
+
+    assert sorted(data) == ["product_data", "sales_data_2025"]
+    assert len(data["sales_data_2025"]) == 2
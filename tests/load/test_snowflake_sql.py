@@ -0,0 +1,33 @@
+import re
+
+from include.etl.load.snowflake_sql import make_stage_path, parquet_load_statements
+
+
+def test_stage_path_is_a_unique_directory():
+    """Stage paths end in a slash and differ per load, so sibling tables and reloads never share a prefix."""
+    path = make_stage_path("DB", "cleansed_layer", "sales", load_id="abc123")
+    assert path == "@~/retail_etl/DB/cleansed_layer/sales/abc123/"
+    assert not make_stage_path("DB", "cleansed_layer", "sales_data", load_id="abc123").startswith(path)
+    assert make_stage_path("DB", "cleansed_layer", "sales") != make_stage_path("DB", "cleansed_layer", "sales")
+
+
+def test_parquet_load_statements():
+    stage_path = make_stage_path("DB", "cleansed_layer", "sales", load_id="abc123")
+    statements = parquet_load_statements("/tmp/x/sales.parquet", "DB", "cleansed_layer", "sales", stage_path)
+    create_format, put, create_table, copy_into = [" ".join(s.split()) for s in statements]
+
+    assert create_format == ("CREATE TEMPORARY FILE FORMAT IF NOT EXISTS DB.cleansed_layer.retail_etl_parquet "
+                             "TYPE = PARQUET USE_LOGICAL_TYPE = TRUE")
+    assert put == f"PUT 'file:///tmp/x/sales.parquet' {stage_path} OVERWRITE = TRUE AUTO_COMPRESS = FALSE"
+
+    assert create_table.startswith("CREATE OR REPLACE TABLE DB.cleansed_layer.sales USING TEMPLATE")
+    assert (f"INFER_SCHEMA(LOCATION => '{stage_path}', FILE_FORMAT => 'DB.cleansed_layer.retail_etl_parquet')"
+            in create_table)
+
+    assert copy_into.startswith(f"COPY INTO DB.cleansed_layer.sales FROM {stage_path} ")
+    assert "MATCH_BY_COLUMN_NAME = CASE_INSENSITIVE" in copy_into
+    assert copy_into.endswith("PURGE = TRUE")
+
+    # Every statement that touches the stage addresses exactly this load's directory
+    for statement in (put, create_table, copy_into):
+        assert re.findall(r"@~/\S+?/(?=['\s]|$)", statement) == [stage_path]
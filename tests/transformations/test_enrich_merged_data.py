@@ -1,4 +1,5 @@
 import pytest
+import numpy as np
 import pandas as pd
 
 from include.etl.transformations.enrich_merged_data import enrich_merged_data
@@ -8,17 +9,17 @@ def valid_sample_data():
     return pd.DataFrame({
         "sales_id": [1, 2],
         "product_id": [101, 102],
-        "region": ["US", "EU"],
+        "region": pd.array(["US", "EU"], dtype="string[pyarrow]"),
         "quantity": [5, 3],
         "price": [100.0, 150.0],
-        "timestamp": pd.to_datetime(["2025-08-01 12:00:00", "2025-08-02 15:30:00"]),
+        "timestamp": np.array(["2025-08-01T12:00:00", "2025-08-02T15:30:00"], dtype="datetime64[ns]"),
         "discount": [0.0, 0.0],
-        "order_status": ["shipped", "pending"],
-        "category": ["electronics", "furniture"],
-        "brand": ["BRAND1", "BRAND2"],
+        "order_status": pd.array(["shipped", "pending"], dtype="string[pyarrow]"),
+        "category": pd.array(["electronics", "furniture"], dtype="string[pyarrow]"),
+        "brand": pd.array(["BRAND1", "BRAND2"], dtype="string[pyarrow]"),
         "rating": [4.5, 3.0],
         "in_stock": [True, False],
-        "launch_date": pd.to_datetime(["2025-01-01", "2025-02-15"]),
+        "launch_date": np.array(["2025-01-01", "2025-02-15"], dtype="datetime64[ns]"),
         "total_sales": [50.0, 1000.0]
     })
 
@@ -28,11 +29,12 @@ def test_enrich_merged_data_transformation(valid_sample_data):
     for col in ["month", "weekday", "hour", "sales_bucket"]:
         assert col in df_enriched.columns, f"{col} should be present in enriched DataFrame"
 
-    assert df_enriched["hour"].tolist() == [12, 15]
-    assert df_enriched["month"].tolist() == ["2025-08", "2025-08"]
+    df_by_sale = df_enriched.sort_values("sales_id")
+    assert df_by_sale["hour"].tolist() == [12, 15]
+    assert df_by_sale["month"].tolist() == ["2025-08", "2025-08"]
 
     allowed_buckets = ["Low", "Medium", "High"]
-    assert all(bucket in allowed_buckets for bucket in df_enriched["sales_bucket"]), \
+    assert df_enriched["sales_bucket"].isin(allowed_buckets).all(), \
         "All sales_bucket values should be one of Low, Medium, High"
 
     assert df_enriched.shape[0] == valid_sample_data.shape[0]
@@ -0,0 +1,26 @@
+import pandas as pd
+
+from include.etl.transformations.generate_hourly_sales_trends import generate_hourly_sales_trends
+
+
+def sample_enriched_df():
+    """North/electronics ties at hours 9 and 14, listed with the later hour first."""
+    return pd.DataFrame({
+        "region": pd.Categorical(["south", "north", "north", "north", "north"]),
+        "category": pd.Categorical(["books", "electronics", "electronics", "electronics", "books"]),
+        "hour": [10, 14, 9, 20, 8],
+        "total_sales": [50.0, 300.0, 300.0, 100.0, 75.0],
+    })
+
+
+def test_peak_hour_tie_resolves_to_lowest_hour():
+    result = generate_hourly_sales_trends(sample_enriched_df()).set_index(["region", "category"])
+    assert result.loc[("north", "electronics"), "peak_hour"] == 9
+    assert result.loc[("north", "electronics"), "max_sales"] == 300.0
+
+
+def test_peak_trends_ordered_by_region_and_category():
+    result = generate_hourly_sales_trends(sample_enriched_df())
+    assert list(zip(result["region"], result["category"])) == [
+        ("north", "books"), ("north", "electronics"), ("south", "books")
+    ]
@@ -0,0 +1,24 @@
+import numpy as np
+import pandas as pd
+
+from include.etl.transformations.generate_seasonal_sales_patterns import generate_seasonal_sales_patterns
+
+
+def sample_enriched_df():
+    """Two Q1 2024 orders, one Q2 2024 order and one order with a missing timestamp."""
+    return pd.DataFrame({
+        "timestamp": np.array(["2024-01-15T10:00", "2024-03-31T23:00", "NaT", "2024-04-01T00:00"],
+                              dtype="datetime64[ns]"),
+        "category": pd.Categorical(["books", "books", "books", "books"]),
+        "total_sales": [100.0, 50.0, 999.0, 25.0],
+    })
+
+
+def test_quarters_ignore_missing_timestamps():
+    """A NaT row is left out instead of turning every quarter label into a float."""
+    result = generate_seasonal_sales_patterns(sample_enriched_df()).set_index("quarter")
+
+    assert sorted(result.index.astype(str)) == ["2024Q1", "2024Q2"]
+    assert result.loc["2024Q1", "total_sales"] == 150.0
+    assert result.loc["2024Q1", "order_count"] == 2
+    assert result.loc["2024Q2", "order_count"] == 1
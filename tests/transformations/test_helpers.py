@@ -0,0 +1,43 @@
+import pytest
+import numpy as np
+import pandas as pd
+
+from include.etl.transformations.helpers import key_stats, safe_datetime_conversion
+
+TIMESTAMP_FORMAT = "%d-%m-%y %H:%M"
+MALFORMED_TIMESTAMPS = [
+    "01-01-25 12:00", " 01-01-25 12:00", "01-01-25 12:00 ", "1-1-25 9:05", "32-01-25 12:00",
+    "01-01-2025 12:00", "01-01-25 12:00:30", "01-01-25T12:00", "garbage", "", None,
+]
+
+
+@pytest.mark.parametrize("values, expected", [
+    ([1, 2, 3], {"null_count": 0, "unique_count": 3, "duplicate_count": 0}),
+    ([1, 1, 2, 2, 2], {"null_count": 0, "unique_count": 2, "duplicate_count": 3}),
+    ([1.0, None, 2.0, None], {"null_count": 2, "unique_count": 2, "duplicate_count": 1}),
+    ([], {"null_count": 0, "unique_count": 0, "duplicate_count": 0}),
+], ids=["unique", "duplicates", "nulls", "empty"])
+def test_key_stats_counts(values, expected):
+    series = pd.Series(values, dtype="float64")
+    assert key_stats(series) == expected
+    # duplicate_count agrees with pandas' own duplicate detection, which treats repeated nulls as duplicates
+    assert expected["duplicate_count"] == series.duplicated().sum()
+
+
+@pytest.mark.parametrize("errors", ["coerce", "raise"])
+def test_arrow_datetime_parsing_matches_pandas(errors):
+    """The pyarrow strptime branch parses exactly the values pandas parses, including padded and malformed ones."""
+    values = MALFORMED_TIMESTAMPS if errors == "coerce" else MALFORMED_TIMESTAMPS[1:2]
+    arrow_df = pd.DataFrame({"timestamp": pd.array(values, dtype="string[pyarrow]")})
+    object_df = pd.DataFrame({"timestamp": pd.Series(values, dtype=object)})
+
+    arrow_result = safe_datetime_conversion(arrow_df, "timestamp", TIMESTAMP_FORMAT, errors=errors)
+    pandas_result = safe_datetime_conversion(object_df, "timestamp", TIMESTAMP_FORMAT, errors=errors)
+
+    if errors == "raise":
+        # Both branches reject the padded value and hand back the unconverted frame
+        assert arrow_result["timestamp"].dtype == arrow_df["timestamp"].dtype
+        assert pandas_result["timestamp"].dtype == object_df["timestamp"].dtype
+    else:
+        np.testing.assert_array_equal(arrow_result["timestamp"].to_numpy("datetime64[ns]"),
+                                      pandas_result["timestamp"].to_numpy("datetime64[ns]"))
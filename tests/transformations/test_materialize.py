@@ -0,0 +1,60 @@
+import os
+import pytest
+import pandas as pd
+
+from include.etl.materialize import materialize, read_materialized, reads_columns, expire_run_folders
+
+
+@pytest.fixture
+def sample_df():
+    return pd.DataFrame({
+        "region": pd.array(["north", "south"], dtype="string[pyarrow]"),
+        "hour": [9, 17],
+        "total_sales": [100.0, 250.5],
+    })
+
+
+def test_materialize_round_trip(tmp_path, sample_df):
+    """A materialized frame reads back unchanged, and a column subset reads only those columns."""
+    path = materialize(sample_df, "sample", str(tmp_path / "run"))
+
+    assert path == str(tmp_path / "run" / "sample.parquet")
+    pd.testing.assert_frame_equal(read_materialized(path), sample_df)
+    pd.testing.assert_frame_equal(read_materialized(path, columns=["hour"]), sample_df[["hour"]])
+
+
+def test_read_materialized_missing_file(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        read_materialized(str(tmp_path / "missing.parquet"))
+
+
+@reads_columns(["region", "total_sales"])
+def _columns_seen(df: pd.DataFrame) -> list:
+    return list(df.columns)
+
+
+def test_reads_columns_dispatch(tmp_path, sample_df):
+    """Paths are read with only the declared columns, while DataFrames are passed through untouched."""
+    path = materialize(sample_df, "sample", str(tmp_path))
+
+    assert _columns_seen(path) == ["region", "total_sales"]
+    assert _columns_seen(sample_df) == ["region", "hour", "total_sales"]
+
+
+def test_expire_run_folders_keeps_recent_runs(tmp_path, sample_df):
+    """Only run folders older than the retention window are removed."""
+    now = 1_000_000_000.0
+    old_path = materialize(sample_df, "sales", str(tmp_path / "old_run"))
+    recent_path = materialize(sample_df, "sales", str(tmp_path / "recent_run"))
+    os.utime(tmp_path / "old_run", (now - 73 * 3600, now - 73 * 3600))
+    os.utime(tmp_path / "recent_run", (now - 3600, now - 3600))
+
+    expired = expire_run_folders(str(tmp_path), max_age_hours=72, now=now)
+
+    assert expired == [str(tmp_path / "old_run")]
+    assert not os.path.exists(old_path)
+    assert os.path.exists(recent_path)
+
+
+def test_expire_run_folders_missing_root(tmp_path):
+    assert expire_run_folders(str(tmp_path / "missing"), max_age_hours=72) == []
@@ -1,4 +1,5 @@
 import pytest
+import numpy as np
 import pandas as pd
 
 from include.etl.transformations.merge_sales_and_products import merge_sales_and_products
@@ -6,45 +7,65 @@ from include.etl.transformations.transform_products_data import transform_produc
 from include.etl.transformations.transform_sales_data import transform_sales_data
 
 
+@pytest.fixture(scope="session")
 def sample_sales_df():
     """Create a sample sales DataFrame matching the input schema."""
     return pd.DataFrame({
         "sales_id": [1, 2, 3],
         "product_id": [101, 102, 103],
-        "region": ["north", "south", "east"],
+        "region": pd.array(["north", "south", "east"], dtype="string[pyarrow]"),
         "quantity": [2, 1, 5],
         "price": [50.0, 100.0, 20.0],
-        "timestamp": pd.to_datetime(["2025-01-01 12:00", "2025-01-02 13:00", "2025-01-03 14:00"]),
+        "timestamp": np.array(["2025-01-01T12:00", "2025-01-02T13:00", "2025-01-03T14:00"], dtype="datetime64[ns]"),
         "discount": [0.0, 0.1, 0.0],
-        "order_status": ["completed", "cancelled", "pending"]
+        "order_status": pd.array(["completed", "cancelled", "pending"], dtype="string[pyarrow]")
     })
 
+@pytest.fixture(scope="session")
 def sample_products_df():
     """Create a sample products DataFrame matching the input schema."""
     return pd.DataFrame({
         "product_id": [101, 102, 103],
-        "category": ["electronics", "clothing", "books"],
-        "brand": ["Sony", "Nike", "Penguin"],
+        "category": pd.array(["electronics", "clothing", "books"], dtype="string[pyarrow]"),
+        "brand": pd.array(["Sony", "Nike", "Penguin"], dtype="string[pyarrow]"),
         "rating": [4.5, 4.0, 5.0],
         "in_stock": [True, True, False],
-        "launch_date": pd.to_datetime(["2025-01-01", "2025-02-01", "2025-03-01"])
+        "launch_date": np.array(["2025-01-01", "2025-02-01", "2025-03-01"], dtype="datetime64[ns]")
     })
 
 
-def test_merge_sales_and_products_success():
+@pytest.fixture(scope="session")
+def transformed_sales(sample_sales_df):
+    """Transform the sample sales once and share the result across merge tests."""
+    return transform_sales_data(sample_sales_df)
+
+@pytest.fixture(scope="session")
+def transformed_products(sample_products_df):
+    """Transform the sample products once and share the result across merge tests."""
+    return transform_products_data(sample_products_df)
+
+
+def test_merge_sales_and_products_success(transformed_sales, transformed_products):
     """Test that merge_sales_and_products returns correct merged DataFrame."""
-    sales_df = transform_sales_data(sample_sales_df())
-    products_df = transform_products_data(sample_products_df())
-    merged = merge_sales_and_products(sales_df, products_df)
+    merged = merge_sales_and_products(transformed_sales, transformed_products)
     assert "product_id" in merged.columns
     assert "sales_id" in merged.columns
-    assert len(merged) <= len(sales_df)
+    assert len(merged) <= len(transformed_sales)
 
-def test_merge_sales_and_products_inner_join():
+def test_merge_sales_and_products_inner_join(transformed_sales, transformed_products):
     """Test that only matching product_ids are merged."""
-    sales_df = transform_sales_data(sample_sales_df())
-    products_df = transform_products_data(sample_products_df())
-    products_df = products_df[products_df["product_id"] != 102]
-    merged = merge_sales_and_products(sales_df, products_df)
+    products_df = transformed_products.loc[lambda d: d["product_id"] != 102]
+    merged = merge_sales_and_products(transformed_sales, products_df)
     assert 102 not in merged["product_id"].values
 
+
+def test_merge_sales_and_products_overlapping_columns(transformed_sales, transformed_products):
+    """Non-key columns present on both sides are kept with _x/_y suffixes, as pd.merge does."""
+    sales_df = transformed_sales.assign(updated_at=pd.Timestamp("2025-01-05"))
+    products_df = transformed_products.assign(updated_at=pd.Timestamp("2025-02-05"))
+    merged = merge_sales_and_products(sales_df, products_df)
+
+    assert "updated_at" not in merged.columns
+    assert (merged["updated_at_x"] == pd.Timestamp("2025-01-05")).all()
+    assert (merged["updated_at_y"] == pd.Timestamp("2025-02-05")).all()
+    assert list(merged.columns) == list(pd.merge(sales_df, products_df, on="product_id", how="inner").columns)
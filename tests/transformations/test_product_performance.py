@@ -1,13 +1,23 @@
+import re
 import pandas as pd
 import pytest
-from include.etl.transformations.generate_product_sales_performance import generate_product_sales_performance
+from include.etl.transformations.generate_product_sales_performance import (
+    generate_product_sales_performance,
+    performance_tier_case_sql
+)
+
+# Product 101 sells 5 + 3 units for 5000 + 3000 revenue, rated 4.5 and 4.0
+EXPECTED_101_REVENUE = 8000.0
+EXPECTED_101_UNITS = 8
+EXPECTED_101_RATING = 4.25
 
 @pytest.fixture
 def sample_merged_df():
     return pd.DataFrame({
         "product_id": [101, 101, 102, 103],
-        "category": ["electronics", "electronics", "furniture", "furniture"],
-        "brand": ["APPLE", "APPLE", "IKEA", "IKEA"],
+        "category": pd.Categorical(["electronics", "electronics", "furniture", "furniture"],
+                                   categories=["electronics", "furniture"]),
+        "brand": pd.Categorical(["APPLE", "APPLE", "IKEA", "IKEA"], categories=["APPLE", "IKEA"]),
         "quantity": [5, 3, 10, 2],
         "total_sales": [5000.0, 3000.0, 20000.0, 8000.0],
         "rating": [4.5, 4.0, 3.5, 4.2]
@@ -21,10 +31,40 @@ def test_generate_product_sales_performance(sample_merged_df):
 
     assert df_perf["product_id"].nunique() == 3
 
-    row_101 = df_perf[df_perf["product_id"] == 101].iloc[0]
-    assert row_101["total_revenue"] == 8000.0
-    assert row_101["total_units_sold"] == 8
-    assert abs(row_101["average_rating"] - 4.25) < 1e-6
+    row_101 = df_perf.set_index("product_id").loc[101]
+    assert row_101["total_revenue"] == EXPECTED_101_REVENUE
+    assert row_101["total_units_sold"] == EXPECTED_101_UNITS
+    assert abs(row_101["average_rating"] - EXPECTED_101_RATING) < 1e-6
 
     allowed_tiers = ["Low Performer", "Average", "Bestseller"]
-    assert all(tier in allowed_tiers for tier in df_perf["performance_tier"])
+    # performance_tier is categorical, so checking its categories covers every row
+    assert df_perf["performance_tier"].cat.categories.isin(allowed_tiers).all()
+    assert df_perf["performance_tier"].notna().all()
+
+
+def _evaluate_case_sql(case_sql, revenue):
+    """Apply the WHEN branches of a CASE expression in order, returning None when none match."""
+    for bound, label in re.findall(r"WHEN total_revenue > ([\d.]+) THEN '([^']+)'", case_sql):
+        if revenue > float(bound):
+            return label
+    return None
+
+
+def test_sql_tiers_match_python_tiers():
+    """The Snowflake CASE and the Python bins put boundary revenues in the same tier."""
+    revenues = [0.0, 1.0, 19999.99, 20000.0, 20000.01, 49999.99, 50000.0, 50000.01, 1e7]
+    merged_df = pd.DataFrame({
+        "product_id": range(1, len(revenues) + 1),
+        "category": pd.Categorical(["electronics"] * len(revenues)),
+        "brand": pd.Categorical(["APPLE"] * len(revenues)),
+        "quantity": 1,
+        "total_sales": revenues,
+        "rating": 4.0,
+    })
+
+    python_tiers = generate_product_sales_performance(merged_df).set_index("total_revenue")["performance_tier"]
+    case_sql = performance_tier_case_sql("total_revenue")
+
+    for revenue in revenues:
+        expected = python_tiers.loc[revenue]
+        assert _evaluate_case_sql(case_sql, revenue) == (None if pd.isna(expected) else expected), revenue
@@ -6,40 +6,43 @@ def sample_products_df():
     """Sample DataFrame for testing product transformations."""
     return pd.DataFrame({
         "product_id": [101, 102, 103, 104],
-        "category": ["Electronics ", "furniture", "Toys", None],
-        "brand": ["apple", "IKEA", "LEGO", "nike"],
+        "category": pd.array(["Electronics ", "furniture", "Toys", None], dtype="string[pyarrow]"),
+        "brand": pd.array(["apple", "IKEA", "LEGO", "nike"], dtype="string[pyarrow]"),
         "rating": [4.5, 4.0, 3.5, 5.0],
         "in_stock": [10, 0, 5, 3],
-        "launch_date": ["2025-01-01", "2025-02-01", "2025-03-01", "2025-04-01"]
+        "launch_date": pd.array(["2025-01-01", "2025-02-01", "2025-03-01", "2025-04-01"], dtype="string[pyarrow]")
     })
 
-def test_required_columns_present():
+@pytest.fixture(scope="module")
+def transformed_products():
+    """Transform the sample products once per module."""
+    return transform_products_data(sample_products_df())
+
+
+def test_required_columns_present(transformed_products):
     """Check that all required columns exist in the transformed products DataFrame."""
-    df = sample_products_df()
-    transformed = transform_products_data(df)
     expected_cols = ["product_id", "category", "brand", "rating", "in_stock", "launch_date"]
-    assert set(expected_cols).issubset(transformed.columns)
+    assert set(expected_cols).issubset(transformed_products.columns)
 
 
-def test_clean_string_columns():
+@pytest.mark.parametrize("col,check", [
+    ("category", lambda s: (s == s.str.lower()).all()),
+    ("brand", lambda s: (s == s.str.upper()).all()),
+])
+def test_clean_string_columns(transformed_products, col, check):
     """Ensure 'category' is lowercase and 'brand' is uppercase after transformation."""
-    df = sample_products_df()
-    transformed = transform_products_data(df)
-    assert all(transformed["category"] == transformed["category"].str.lower())
-    assert all(transformed["brand"] == transformed["brand"].str.upper())
+    assert check(transformed_products[col])
 
 
-def test_drop_na_rows():
+def test_drop_na_rows(transformed_products):
     """Check that rows with missing required columns are dropped."""
-    df = sample_products_df()
-    transformed = transform_products_data(df)
-    assert transformed["category"].isna().sum() == 0
+    assert transformed_products["category"].isna().sum() == 0
 
 
 def test_drop_duplicates():
     """Verify that duplicate rows are removed in the transformed DataFrame."""
     df = sample_products_df()
-    df = pd.concat([df, df.iloc[[0]]], ignore_index=True)
+    df = df.reindex([*df.index, 0])
     transformed = transform_products_data(df)
     assert len(transformed) == len(df.dropna(subset=["product_id", "category", "brand", "rating", "in_stock", "launch_date"]).drop_duplicates())
 
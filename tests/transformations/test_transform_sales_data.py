@@ -1,60 +1,58 @@
 import pytest
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 
-from include.etl.transformations.transform_sales_data import transform_sales_data
+from include.etl.transformations.transform_sales_data import transform_sales_data, transform_sales_data_arrow
 
 def sample_sales_df():
     """Creating sample DataFrame for testing sales transformations."""
     return pd.DataFrame({
         "sales_id": [1, 2, 3, 4],
         "product_id": [101, 102, 103, 104],
-        "region": ["North ", "south", "EAST", "west"],
+        "region": pd.array(["North ", "south", "EAST", "west"], dtype="string[pyarrow]"),
         "quantity": [2, 0, 3, 1],
         "price": [50, 100, 0, 20],
-        "timestamp": ["01-01-25 12:00", "02-01-25 13:00", "03-01-25 14:00", "04-01-25 15:00"],
-        "order_status": ["Completed", "Cancelled", "pending", "Returned"],
+        "timestamp": pd.array(["01-01-25 12:00", "02-01-25 13:00", "03-01-25 14:00", "04-01-25 15:00"], dtype="string[pyarrow]"),
+        "order_status": pd.array(["Completed", "Cancelled", "pending", "Returned"], dtype="string[pyarrow]"),
         # discount
     })
 
-def test_required_columns_present():
+@pytest.fixture(scope="module")
+def transformed_sales():
+    """Transform the sample sales once per module."""
+    return transform_sales_data(sample_sales_df())
+
+
+def test_required_columns_present(transformed_sales):
     """Check that all required columns exist in the transformed sales DataFrame."""
-    df = sample_sales_df()
-    transformed = transform_sales_data(df)
     expected_cols = ["sales_id", "product_id", "region", "quantity", "price",
                      "timestamp", "order_status", "discount", "total_sales"]
-    assert set(expected_cols).issubset(transformed.columns)
+    assert set(expected_cols).issubset(transformed_sales.columns)
 
 
-def test_lowercase_region_order_status():
+@pytest.mark.parametrize("col", ["region", "order_status"])
+def test_lowercase_region_order_status(transformed_sales, col):
     """Ensure 'region' and 'order_status' columns are converted to lowercase."""
-    df = sample_sales_df()
-    transformed = transform_sales_data(df)
-    assert all(transformed["region"] == transformed["region"].str.lower())
-    assert all(transformed["order_status"] == transformed["order_status"].str.lower())
+    assert all(transformed_sales[col] == transformed_sales[col].str.lower())
 
 
-def test_filter_zero_quantity_or_price():
+@pytest.mark.parametrize("col", ["quantity", "price"])
+def test_filter_zero_quantity_or_price(transformed_sales, col):
     """Check that rows with zero 'quantity' or 'price' are removed."""
-    df = sample_sales_df()
-    transformed = transform_sales_data(df)
-    assert (transformed["quantity"] > 0).all()
-    assert (transformed["price"] > 0).all()
+    assert (transformed_sales[col] > 0).all()
 
 
-def test_discount_column_added():
+def test_discount_column_added(transformed_sales):
     """Verify that the 'discount' column is added and filled with 0.0 if missing."""
-    df = sample_sales_df()
-    transformed = transform_sales_data(df)
-    assert (transformed["discount"] == 0.0).all()
+    assert (transformed_sales["discount"] == 0.0).all()
 
 
-def test_total_sales_calculation():
+def test_total_sales_calculation(transformed_sales):
     """Validate that 'total_sales' is correctly calculated as quantity * price * (1 - discount)."""
-    df = sample_sales_df()
-    transformed = transform_sales_data(df)
-    for idx, row in transformed.iterrows():
-        expected_total = row["quantity"] * row["price"] * (1 - row["discount"])
-        assert row["total_sales"] == expected_total
+    expected = (transformed_sales["quantity"].to_numpy() * transformed_sales["price"].to_numpy()
+                * (1.0 - transformed_sales["discount"].to_numpy()))
+    np.testing.assert_allclose(transformed_sales["total_sales"].to_numpy(), expected, rtol=0, atol=0)
 
 
 def test_missing_required_columns():
@@ -70,4 +68,85 @@ def test_missing_required_columns():
     })
 
     with pytest.raises(ValueError, match="Missing required columns"):
-        transform_sales_data(df)
\ No newline at end of file
+        transform_sales_data(df)
+
+NOW_TS = pd.Timestamp("2025-06-01 00:00")
+
+
+def sample_sales_table(**overrides):
+    """Create a standardized sales table as the Arrow kernel receives it."""
+    columns = {
+        "sales_id": pa.array([1, 2, 3, 4], type=pa.int64()),
+        "product_id": pa.array([101, 102, 103, 104], type=pa.int64()),
+        "region": pa.array(["north", "south", "east", "west"]),
+        "quantity": pa.array([2, 1, 3, 1], type=pa.int64()),
+        "price": pa.array([50.0, 100.0, 20.0, 10.0]),
+        "timestamp": pa.array(np.array(["2025-01-01T12:00", "2025-01-02T13:00", "2025-01-03T14:00",
+                                        "2025-01-04T15:00"], dtype="datetime64[ns]")),
+        "order_status": pa.array(["completed", "cancelled", "pending", "returned"]),
+    }
+    columns.update(overrides)
+    return pa.table(columns)
+
+
+@pytest.mark.parametrize("statuses", [
+    ["completed", None, "pending", "returned"],
+    ["completed", "lost", "pending", "returned"],
+])
+def test_arrow_drops_null_and_unknown_statuses(statuses):
+    """Rows whose status is missing or not a valid status are removed."""
+    table = transform_sales_data_arrow(sample_sales_table(order_status=pa.array(statuses)), NOW_TS)
+    assert table["sales_id"].to_pylist() == [1, 3, 4]
+
+
+def test_arrow_drops_future_timestamps():
+    """Rows stamped after now_ts are removed."""
+    timestamps = np.array(["2025-01-01T12:00", "2025-07-01T00:00", "2025-01-03T14:00", "2025-06-01T00:00"],
+                          dtype="datetime64[ns]")
+    table = transform_sales_data_arrow(sample_sales_table(timestamp=pa.array(timestamps)), NOW_TS)
+    assert table["sales_id"].to_pylist() == [1, 3, 4]
+
+
+def test_arrow_cleans_region_and_status():
+    """Region and status are trimmed and lowercased before filtering."""
+    table = transform_sales_data_arrow(sample_sales_table(
+        region=pa.array([" North", "SOUTH ", "east", "West"]),
+        order_status=pa.array(["Completed ", "CANCELLED", " pending", "returned"]),
+    ), NOW_TS)
+    assert table["region"].to_pylist() == ["north", "south", "east", "west"]
+    assert table["order_status"].to_pylist() == ["completed", "cancelled", "pending", "returned"]
+
+
+def test_arrow_adds_missing_discount():
+    """A missing discount column is added as zeros and total_sales is quantity * price."""
+    table = transform_sales_data_arrow(sample_sales_table(), NOW_TS)
+    assert table["discount"].to_pylist() == [0.0, 0.0, 0.0, 0.0]
+    assert table["total_sales"].to_pylist() == [100.0, 100.0, 60.0, 10.0]
+
+
+def test_arrow_fills_null_discount():
+    """Null discounts are filled with 0.0 before total_sales is computed."""
+    table = transform_sales_data_arrow(sample_sales_table(discount=pa.array([0.5, None, 0.0, 0.1])), NOW_TS)
+    assert table["discount"].to_pylist() == [0.5, 0.0, 0.0, 0.1]
+    np.testing.assert_allclose(table["total_sales"].to_numpy(), [50.0, 100.0, 60.0, 9.0])
+
+
+def test_arrow_duplicates_keep_first_row():
+    """Repeated sales_ids keep their first row, and the output stays in input order."""
+    table = transform_sales_data_arrow(sample_sales_table(
+        sales_id=pa.array([3, 1, 3, 2], type=pa.int64()),
+    ), NOW_TS)
+    assert table["sales_id"].to_pylist() == [3, 1, 2]
+    assert table["product_id"].to_pylist() == [101, 102, 104]
+
+
+def test_arrow_dedups_across_chunks():
+    """A sales_id repeated in a later record batch is dropped in favour of the earlier one."""
+    first = sample_sales_table()
+    second = sample_sales_table(product_id=pa.array([201, 202, 203, 204], type=pa.int64()))
+    table = pa.Table.from_batches(first.to_batches() + second.to_batches())
+    assert table["sales_id"].num_chunks == 2
+
+    result = transform_sales_data_arrow(table, NOW_TS)
+    assert result["sales_id"].to_pylist() == [1, 2, 3, 4]
+    assert result["product_id"].to_pylist() == [101, 102, 103, 104]
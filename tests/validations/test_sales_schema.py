@@ -0,0 +1,98 @@
+import pytest
+import numpy as np
+import pandas as pd
+
+from pandera.errors import SchemaError
+
+from include.validations import sales_schema
+from include.validations._fast import fast_validate, strict_validation_enabled
+from include.validations.sales_schema import make_output_sales_schema, make_output_sales_spec
+
+NOW_TS = pd.Timestamp("2025-06-01 00:00")
+
+
+def valid_sales_df():
+    """Create a cleaned sales DataFrame that passes the output schema."""
+    return pd.DataFrame({
+        "sales_id": [1, 2, 3],
+        "product_id": [101, 102, 103],
+        "region": pd.array(["north", "south", "east"], dtype="string[pyarrow]"),
+        "quantity": [2, 1, 5],
+        "price": [50.0, 100.0, 20.0],
+        "timestamp": np.array(["2025-01-01T12:00", "2025-01-02T13:00", "2025-06-01T00:00"], dtype="datetime64[ns]"),
+        "discount": [0.0, 0.1, 1.0],
+        "order_status": pd.array(["completed", "cancelled", "pending"], dtype="string[pyarrow]"),
+    })
+
+
+def _set(col, values):
+    def mutate(df):
+        df[col] = values
+        return df
+    return mutate
+
+
+INVALID_CASES = {
+    "range": _set("price", [50.0, -1.0, 20.0]),
+    "in_range": _set("discount", [0.0, 1.5, 0.0]),
+    "isin": _set("order_status", pd.array(["completed", "lost", "pending"], dtype="string[pyarrow]")),
+    "dtype": _set("quantity", [2.0, 1.0, 5.0]),
+    "nullable": _set("product_id", [101.0, None, 103.0]),
+    "missing_column": lambda df: df.drop(columns=["region"]),
+    "future_timestamp": _set("timestamp", np.array(["2025-01-01T12:00", "2025-06-01T00:01", "2025-01-03T14:00"],
+                                                   dtype="datetime64[ns]")),
+}
+
+
+@pytest.mark.parametrize("validate", [
+    lambda df: fast_validate(df, make_output_sales_spec(NOW_TS)),
+    lambda df: make_output_sales_schema(NOW_TS).validate(df),
+], ids=["fast", "pandera"])
+def test_valid_sales_pass(validate):
+    """A clean frame passes both the fast kernel and the Pandera schema."""
+    df = valid_sales_df()
+    assert validate(df) is not None
+
+
+@pytest.mark.parametrize("case", INVALID_CASES.keys())
+@pytest.mark.parametrize("validate", [
+    lambda df: fast_validate(df, make_output_sales_spec(NOW_TS)),
+    lambda df: make_output_sales_schema(NOW_TS).validate(df),
+], ids=["fast", "pandera"])
+def test_invalid_sales_raise(validate, case):
+    """Each invalid frame is rejected by both the fast kernel and the Pandera schema."""
+    df = INVALID_CASES[case](valid_sales_df())
+    with pytest.raises(SchemaError):
+        validate(df)
+
+
+@pytest.mark.parametrize("env, expected", [(None, False), ("1", True)])
+def test_strict_validation_enabled(monkeypatch, env, expected):
+    """STRICT_VALIDATION switches the output boundary to the full Pandera schema."""
+    if env is None:
+        monkeypatch.delenv("STRICT_VALIDATION", raising=False)
+    else:
+        monkeypatch.setenv("STRICT_VALIDATION", env)
+    assert strict_validation_enabled() is expected
+
+
+@pytest.mark.parametrize("env, expected", [(None, "fast"), ("1", "pandera")])
+def test_output_sales_validator_dispatch(monkeypatch, env, expected):
+    """validate_output_sales_schema runs the fast kernel by default and Pandera under STRICT_VALIDATION."""
+    if env is None:
+        monkeypatch.delenv("STRICT_VALIDATION", raising=False)
+    else:
+        monkeypatch.setenv("STRICT_VALIDATION", env)
+
+    calls = []
+    monkeypatch.setattr(sales_schema, "fast_validate", lambda df, specs: calls.append("fast") or df)
+    make_schema = sales_schema.make_output_sales_schema
+
+    def recording_schema(now_ts):
+        calls.append("pandera")
+        return make_schema(now_ts)
+
+    monkeypatch.setattr(sales_schema, "make_output_sales_schema", recording_schema)
+
+    sales_schema.validate_output_sales_schema(valid_sales_df(), NOW_TS)
+    assert calls == [expected]